@@ -1,7 +1,30 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 import re
+import logging
+import functools
+from operator import itemgetter
 from enum import Enum
 
+try:
+    import re2  # google-re2, optional
+except ImportError:
+    re2 = None
+
+# Splits text into word runs and single punctuation marks, so "what's" -> what, ', s
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+# Leading literal(s) of an intent pattern: \b(a|b|c)\b... or \bword\b...
+LEADING_KEYWORDS_PATTERN = re.compile(r"^\\b(?:\(([^()\\]+)\)|([\w' ]+?))(?:\\b|\\s)")
+
+def _to_24h(hour: str, minute: str, ampm: Optional[str]) -> str:
+    """Normalize a matched clock time to HH:MM."""
+    hour = int(hour)
+    if ampm == 'pm' and hour < 12:
+        hour += 12
+    elif ampm == 'am' and hour == 12:
+        hour = 0
+    return f"{hour:02d}:{minute}"
+
 class Intent(Enum):
     CALENDAR_CREATE = "calendar_create"
     CALENDAR_CHECK = "calendar_check" 
@@ -15,6 +38,19 @@ class Intent(Enum):
     MEMORY_LOOKUP = "memory_lookup"
     GENERAL = "general"
 
+FIELD_REQUIREMENTS: Dict[Intent, Tuple[str, ...]] = {
+    Intent.CALENDAR_CREATE: ("title",),
+    Intent.EMAIL_SEND: ("to", "subject"),
+    Intent.WEATHER: (),
+    Intent.APP_LAUNCH: ("app_name",),
+    Intent.TERMINAL: ("command",),
+    Intent.WEB_SEARCH: ("query",),
+    Intent.MEMORY_LOOKUP: ("query",),
+    Intent.CALENDAR_CHECK: (),
+    Intent.CALENDAR_SEARCH: ("query",),
+    Intent.EMAIL_READ: ()
+}
+
 class IntentClassifier:
     def __init__(self):
         self.patterns = {
@@ -76,18 +112,176 @@ class IntentClassifier:
                 r'\b(context|history|past)\b'
             ]
         }
+        
+        # Compile once; classify_intent/extract_fields run on every utterance
+        self.patterns = {
+            intent: [re.compile(pattern) for pattern in patterns]
+            for intent, patterns in self.patterns.items()
+        }
+        self._intent_rank = {intent: rank for rank, intent in enumerate(self.patterns)}
+        self._build_keyword_index()
+        self._build_fused_patterns()
+        self._build_pattern_set()
+        # Repeated commands skip re-scoring; keyed on the lowered text only
+        self._classify_cached = functools.lru_cache(maxsize=2048)(self._classify_lower)
+        self._activity_patterns = [
+            re.compile(r'\b(gym|workout|meeting|lunch|dinner|appointment|call)\b'),
+            re.compile(r'\bgoing to\s+(\w+)'),
+            re.compile(r'\b(schedule|create|add)\s+([^at]+?)(?:\s+at|\s+for|\s+on|$)')
+        ]
+        self._time_patterns = [
+            re.compile(r'\b(\d{1,2}):(\d{2})\s*(am|pm)?\b'),
+            re.compile(r'\b(\d{1,2})\s*(am|pm)\b')
+        ]
+        self._search_patterns = [
+            re.compile(r'search for (.+?)(?:\.|$)'),
+            re.compile(r'look up (.+?)(?:\.|$)'),
+            re.compile(r'find (.+?)(?:\.|$)'),
+            re.compile(r'google (.+?)(?:\.|$)')
+        ]
+        self._email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
     
-    def classify_intent(self, text: str) -> Tuple[Intent, float]:
-        """Classify intent of input text."""
-        text_lower = text.lower()
-        scores = {}
+    def _build_keyword_index(self):
+        """Index the leading keywords of every pattern in a token trie."""
+        self._keyword_trie = {}
+        self._unindexed = []
         
         for intent, patterns in self.patterns.items():
-            score = 0
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    score += 1
+            for idx, pattern in enumerate(patterns):
+                match = LEADING_KEYWORDS_PATTERN.match(pattern.pattern.replace("\\'", "'"))
+                if not match:
+                    # No literal prefix to key on, always check this pattern
+                    self._unindexed.append((intent, idx))
+                    continue
+                
+                for keyword in (match.group(1) or match.group(2)).split('|'):
+                    node = self._keyword_trie
+                    for token in TOKEN_PATTERN.findall(keyword):
+                        node = node.setdefault(token, {})
+                    node.setdefault(None, {}).setdefault(intent, set()).add(idx)
+        
+        # A literal shared by several patterns/intents ("what's", "run", "open")
+        # sits in the trie once; freeze its hits grouped by intent for the scan
+        nodes = [self._keyword_trie]
+        while nodes:
+            node = nodes.pop()
+            if None in node:
+                node[None] = tuple((intent, frozenset(idxs)) for intent, idxs in node[None].items())
+            nodes.extend(child for token, child in node.items() if token is not None)
+    
+    def _build_fused_patterns(self):
+        """Fuse each intent's patterns into one regex with a named group per pattern."""
+        # Each pattern sits in its own optional lookahead, so one match() call
+        # reports every pattern that search() would have found, overlaps included.
+        # Everything the scoring loop needs per intent is resolved here once:
+        # (fused regex, group names, pattern count, negated rank for tie-breaks)
+        self._fused_table = {}
+        for intent, patterns in self.patterns.items():
+            groups = tuple(f"{intent.name}_{idx}" for idx in range(len(patterns)))
+            fused = re.compile("".join(
+                f"(?:(?=(?s:.*?)(?P<{group}>{pattern.pattern}))|)"
+                for group, pattern in zip(groups, patterns)
+            ))
+            self._fused_table[intent] = (fused, groups, len(patterns), -self._intent_rank[intent])
+    
+    def _build_pattern_set(self):
+        """Compile every pattern into one RE2 set when google-re2 is installed."""
+        self._pattern_set = None
+        self._pattern_set_intents = []
+        if re2 is None:
+            return
+        
+        try:
+            pattern_set = re2.Set.SearchSet(re2.Options())
+            for intent, patterns in self.patterns.items():
+                for pattern in patterns:
+                    pattern_set.Add(pattern.pattern)
+                    self._pattern_set_intents.append(intent)
+            pattern_set.Compile()
+            self._pattern_set = pattern_set
+        except Exception as e:
+            logging.warning(f"RE2 pattern set unavailable, using re: {e}")
+            self._pattern_set_intents = []
+    
+    def _count_set_matches(self, text_lower: str) -> Dict[Intent, int]:
+        """Count matching patterns per intent with the RE2 set."""
+        counts = {}
+        # One DFA pass reports the index of every pattern that matches
+        for idx in self._pattern_set.Match(text_lower) or ():
+            intent = self._pattern_set_intents[idx]
+            counts[intent] = counts.get(intent, 0) + 1
+        return counts
+    
+    def _candidate_patterns(self, text_lower: str) -> Dict[Intent, set]:
+        """Single pass over the input tokens, collecting patterns whose keywords occur."""
+        candidates = {}
+        for intent, idx in self._unindexed:
+            candidates.setdefault(intent, set()).add(idx)
+        
+        tokens = TOKEN_PATTERN.findall(text_lower)
+        for start in range(len(tokens)):
+            node = self._keyword_trie
+            for pos in range(start, len(tokens)):
+                node = node.get(tokens[pos])
+                if node is None:
+                    break
+                for intent, idxs in node.get(None, ()):
+                    candidates.setdefault(intent, set()).update(idxs)
+        
+        return candidates
+    
+    def _classify_candidates(self, text_lower: str) -> Tuple[Intent, float]:
+        """Score candidate intents best-first, stopping once none can win."""
+        candidates = self._candidate_patterns(text_lower)
+        
+        # Upper bound for an intent: every keyword hit turns into a match.
+        # Keys rank ties like max() over self.patterns order did.
+        table = self._fused_table
+        bounds = {}
+        for intent, idxs in candidates.items():
+            _, _, total, neg_rank = table[intent]
+            bounds[intent] = (len(idxs) / total, neg_rank)
+        best_intent, best_key = Intent.GENERAL, (0.0, -len(self._intent_rank))
+        
+        for intent in sorted(bounds, key=bounds.get, reverse=True):
+            if bounds[intent] < best_key:
+                break
+            
+            fused, groups, total, neg_rank = table[intent]
+            # group(*names) fetches every pattern's capture in a single call
+            match = fused.match(text_lower)
+            hits = match.group(*groups) if total > 1 else (match.group(*groups),)
+            score = total - hits.count(None)
+            if not score:
+                continue
             
+            key = (score / total, neg_rank)
+            if key > best_key:
+                best_intent, best_key = intent, key
+        
+        return best_intent, best_key[0]
+    
+    def classify_intent(self, text: str, text_lower: str = None) -> Tuple[Intent, float]:
+        """Classify intent of input text. Pass text_lower if already computed."""
+        return self._classify_cached(text_lower if text_lower is not None else text.lower())
+    
+    def classify_intent_batch(self, texts: List[str]) -> List[Tuple[Intent, float]]:
+        """Classify several utterances (e.g. transcript replay or offline eval)."""
+        # Shares the compiled pattern set and the LRU, so repeats are scored once
+        classify = self._classify_cached
+        return [classify(text.lower()) for text in texts]
+    
+    def _classify_lower(self, text_lower: str) -> Tuple[Intent, float]:
+        """Classify already-lowercased text."""
+        # RE2's \b is ASCII-only, so non-ASCII input keeps Python's semantics
+        if self._pattern_set is None or not text_lower.isascii():
+            return self._classify_candidates(text_lower)
+        
+        counts = self._count_set_matches(text_lower)
+        scores = {}
+        
+        for intent, patterns in self.patterns.items():
+            score = counts.get(intent, 0)
             if score > 0:
                 # Normalize by number of patterns for this intent
                 scores[intent] = score / len(patterns)
@@ -96,84 +290,53 @@ class IntentClassifier:
             return Intent.GENERAL, 0.0
         
         # Return highest scoring intent
-        best_intent = max(scores.keys(), key=lambda x: scores[x])
-        return best_intent, scores[best_intent]
+        return max(scores.items(), key=itemgetter(1))
     
-    def get_required_fields(self, intent: Intent) -> List[str]:
+    def get_required_fields(self, intent: Intent) -> Tuple[str, ...]:
         """Get required fields for intent."""
-        field_requirements = {
-            Intent.CALENDAR_CREATE: ["title"],
-            Intent.EMAIL_SEND: ["to", "subject"],
-            Intent.WEATHER: [],
-            Intent.APP_LAUNCH: ["app_name"],
-            Intent.TERMINAL: ["command"],
-            Intent.WEB_SEARCH: ["query"],
-            Intent.MEMORY_LOOKUP: ["query"],
-            Intent.CALENDAR_CHECK: [],
-            Intent.CALENDAR_SEARCH: ["query"],
-            Intent.EMAIL_READ: []
-        }
-        return field_requirements.get(intent, [])
+        return FIELD_REQUIREMENTS.get(intent, ())
     
-    def extract_fields(self, text: str, intent: Intent) -> Dict[str, str]:
-        """Extract fields from text by intent."""
-        text_lower = text.lower()
+    def extract_fields(self, text: str, intent: Intent, text_lower: str = None) -> Dict[str, str]:
+        """Extract fields from text by intent. Pass text_lower if already computed."""
+        if text_lower is None:
+            text_lower = text.lower()
         fields = {}
         
         if intent == Intent.CALENDAR_CREATE:
             # Extract activity title
-            activity_patterns = [
-                r'\b(gym|workout|meeting|lunch|dinner|appointment|call)\b',
-                r'\bgoing to\s+(\w+)',
-                r'\b(schedule|create|add)\s+([^at]+?)(?:\s+at|\s+for|\s+on|$)'
-            ]
-            for pattern in activity_patterns:
-                match = re.search(pattern, text_lower)
+            for idx, pattern in enumerate(self._activity_patterns):
+                match = pattern.search(text_lower)
                 if match:
-                    if pattern == activity_patterns[1]:
+                    if idx == 1:
                         fields["title"] = match.group(1)
-                    elif pattern == activity_patterns[2]:
+                    elif idx == 2:
                         fields["title"] = match.group(2).strip()
                     else:
                         fields["title"] = match.group(0)
                     break
             
             # Extract time
-            time_patterns = [
-                r'\b(\d{1,2}):(\d{2})\s*(am|pm)?\b',
-                r'\b(\d{1,2})\s*(am|pm)\b'
-            ]
-            for pattern in time_patterns:
-                match = re.search(pattern, text_lower)
+            for idx, pattern in enumerate(self._time_patterns):
+                match = pattern.search(text_lower)
                 if match:
-                    if pattern == time_patterns[0]:
+                    if idx == 0:
                         hour, minute, ampm = match.groups()
-                        if ampm and ampm == 'pm' and int(hour) < 12:
-                            hour = str(int(hour) + 12)
-                        elif ampm and ampm == 'am' and hour == '12':
-                            hour = '00'
-                        fields["time"] = f"{hour.zfill(2)}:{minute}"
                     else:
                         hour, ampm = match.groups()
-                        if ampm == 'pm' and int(hour) < 12:
-                            hour = str(int(hour) + 12)
-                        elif ampm == 'am' and hour == '12':
-                            hour = '00'
-                        fields["time"] = f"{hour.zfill(2)}:00"
+                        minute = "00"
+                    fields["time"] = _to_24h(hour, minute, ampm)
                     break
             
             # Extract date
             if 'tomorrow' in text_lower:
-                from datetime import datetime, timedelta
                 fields["date"] = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
             elif 'today' in text_lower:
-                from datetime import datetime
                 fields["date"] = datetime.now().strftime("%Y-%m-%d")
         
         elif intent == Intent.EMAIL_SEND:
             # Extract recipient
             if '@' in text:
-                email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+                email_match = self._email_pattern.search(text)
                 if email_match:
                     fields["to"] = email_match.group(0)
         
@@ -185,14 +348,8 @@ class IntentClassifier:
         
         elif intent == Intent.WEB_SEARCH:
             # Extract search query
-            search_patterns = [
-                r'search for (.+?)(?:\.|$)',
-                r'look up (.+?)(?:\.|$)',
-                r'find (.+?)(?:\.|$)',
-                r'google (.+?)(?:\.|$)'
-            ]
-            for pattern in search_patterns:
-                match = re.search(pattern, text_lower)
+            for pattern in self._search_patterns:
+                match = pattern.search(text_lower)
                 if match:
                     fields["query"] = match.group(1).strip()
                     break
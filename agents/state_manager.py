@@ -1,35 +1,66 @@
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+import itertools
+import time
 import json
 import logging
 
-@dataclass
+ACTIVE_STATUSES = frozenset(("pending", "in_progress"))
+
 class TaskState:
-    task_type: str
-    status: str = "pending"  # pending, in_progress, completed, failed
-    data: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    # Slotted plain class (no per-instance __dict__); dataclass(slots=True) needs 3.10
+    __slots__ = ("task_type", "status", "data", "created_at", "updated_at")
+    
+    def __init__(self, task_type: str, status: str = "pending", data: Dict[str, Any] = None):
+        self.task_type = task_type
+        self.status = status  # pending, in_progress, completed, failed
+        self.data = data if data is not None else {}
+        # Epoch floats: cheaper than datetime.now(), converted only in to_dict()
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+    
+    def __repr__(self) -> str:
+        return f"TaskState(task_type={self.task_type!r}, status={self.status!r}, data={self.data!r})"
     
     def update(self, **kwargs):
         """Update task data and timestamp."""
         self.data.update(kwargs)
-        self.updated_at = datetime.now()
+        self.updated_at = time.time()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "task_type": self.task_type,
             "status": self.status,
             "data": self.data,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "updated_at": datetime.fromtimestamp(self.updated_at).isoformat()
         }
 
 class StateManager:
     def __init__(self):
         self.active_tasks: Dict[str, TaskState] = {}
         self.session_context: Dict[str, Any] = {}
+        # Pending/in-progress tasks, overall and per task type, kept in sync
+        # by the methods below so lookups don't rescan active_tasks
+        self._active: Dict[str, TaskState] = {}
+        self._active_by_type: Dict[str, Dict[str, TaskState]] = {}
+        self._task_ids = itertools.count()
+    
+    def _index_task(self, task_id: str, task: TaskState):
+        """Add or drop a task from the active indexes based on its status."""
+        by_type = self._active_by_type.setdefault(task.task_type, {})
+        if task.status in ACTIVE_STATUSES:
+            self._active.setdefault(task_id, task)
+            by_type.setdefault(task_id, task)
+        else:
+            self._active.pop(task_id, None)
+            by_type.pop(task_id, None)
+    
+    def _unindex_task(self, task_id: str):
+        """Drop a task id from the active indexes."""
+        task = self._active.pop(task_id, None)
+        if task is not None:
+            self._active_by_type[task.task_type].pop(task_id, None)
     
     def create_task(self, task_id: str, task_type: str, initial_data: Dict[str, Any] = None) -> TaskState:
         """Create new task."""
@@ -37,10 +68,22 @@ class StateManager:
             task_type=task_type,
             data=initial_data or {}
         )
+        self._unindex_task(task_id)
         self.active_tasks[task_id] = task
+        self._index_task(task_id, task)
         logging.info(f"Created task {task_id} of type {task_type}")
         return task
     
+    def get_or_create_inflight(self, task_type: str, initial_data: Dict[str, Any] = None) -> Tuple[str, TaskState, bool]:
+        """Get the oldest active task of a type, or create one. Returns (task_id, task, created)."""
+        active = self._active_by_type.get(task_type)
+        if active:
+            task_id = next(iter(active))
+            return task_id, active[task_id], False
+        
+        task_id = f"{task_type}_{next(self._task_ids)}"
+        return task_id, self.create_task(task_id, task_type, initial_data), True
+    
     def get_task(self, task_id: str) -> Optional[TaskState]:
         """Get task by ID."""
         return self.active_tasks.get(task_id)
@@ -53,7 +96,10 @@ class StateManager:
         task = self.active_tasks[task_id]
         if status:
             task.status = status
-        task.update(**data)
+            self._index_task(task_id, task)
+        # Inlined TaskState.update: data is already a fresh kwargs dict
+        task.data.update(data)
+        task.updated_at = time.time()
         
         logging.info(f"Updated task {task_id}: status={status}, data={data}")
         return True
@@ -65,8 +111,10 @@ class StateManager:
         
         task = self.active_tasks[task_id]
         task.status = "completed"
+        self._index_task(task_id, task)
         if result is not None:
-            task.update(result=result)
+            task.data["result"] = result
+            task.updated_at = time.time()
         
         logging.info(f"Completed task {task_id}")
         return True
@@ -74,10 +122,8 @@ class StateManager:
     def get_active_tasks(self, task_type: str = None) -> Dict[str, TaskState]:
         """Get active tasks, optionally by type."""
         if task_type:
-            return {k: v for k, v in self.active_tasks.items() 
-                   if v.task_type == task_type and v.status in ["pending", "in_progress"]}
-        return {k: v for k, v in self.active_tasks.items() 
-               if v.status in ["pending", "in_progress"]}
+            return dict(self._active_by_type.get(task_type, {}))
+        return dict(self._active)
     
     def set_context(self, key: str, value: Any):
         """Set session context."""
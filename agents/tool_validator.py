@@ -1,9 +1,30 @@
 from typing import Dict, Any, List, Optional, Tuple
-from pydantic import BaseModel, ValidationError
 import logging
 from .intent_classifier import Intent, intent_classifier
 from .state_manager import state_manager
 
+CLARIFICATION_TEMPLATES: Dict[Intent, Dict[str, str]] = {
+    Intent.CALENDAR_CREATE: {
+        "title": "What should I call this event?",
+        "date": "What date is this for? (e.g., tomorrow, today, 2024-03-08)",
+        "time": "What time should this be scheduled for? (e.g., 3:00 PM, 15:00)"
+    },
+    Intent.EMAIL_SEND: {
+        "to": "Who should I send this email to?",
+        "subject": "What should the subject line be?",
+        "content": "What should the email say?"
+    },
+    Intent.WEB_SEARCH: {
+        "query": "What would you like me to search for?"
+    },
+    Intent.APP_LAUNCH: {
+        "app_name": "Which application would you like me to open?"
+    },
+    Intent.TERMINAL: {
+        "command": "What command should I run?"
+    }
+}
+
 class ValidationResult:
     def __init__(self, is_valid: bool, missing_fields: List[str] = None, 
                  extracted_fields: Dict[str, Any] = None, clarification: str = None):
@@ -14,61 +35,35 @@ class ValidationResult:
 
 class ToolValidator:
     def __init__(self):
-        self.clarification_templates = {
-            Intent.CALENDAR_CREATE: {
-                "title": "What should I call this event?",
-                "date": "What date is this for? (e.g., tomorrow, today, 2024-03-08)",
-                "time": "What time should this be scheduled for? (e.g., 3:00 PM, 15:00)"
-            },
-            Intent.EMAIL_SEND: {
-                "to": "Who should I send this email to?",
-                "subject": "What should the subject line be?",
-                "content": "What should the email say?"
-            },
-            Intent.WEB_SEARCH: {
-                "query": "What would you like me to search for?"
-            },
-            Intent.APP_LAUNCH: {
-                "app_name": "Which application would you like me to open?"
-            },
-            Intent.TERMINAL: {
-                "command": "What command should I run?"
-            }
-        }
+        self.clarification_templates = CLARIFICATION_TEMPLATES
     
-    def validate_and_extract(self, user_input: str, intent: Intent) -> ValidationResult:
-        """Validate user input and extract fields."""
+    def validate_and_extract(self, user_input: str, intent: Intent, input_lower: str = None) -> ValidationResult:
+        """Validate user input and extract fields. Pass input_lower to reuse the classifier's lowercasing."""
         # Extract fields from user input
-        extracted_fields = intent_classifier.extract_fields(user_input, intent)
+        extracted_fields = intent_classifier.extract_fields(user_input, intent, text_lower=input_lower)
         required_fields = intent_classifier.get_required_fields(intent)
         
-        # Check for missing required fields
-        missing_fields = []
-        for field in required_fields:
-            if field not in extracted_fields or not extracted_fields[field]:
-                missing_fields.append(field)
+        # Check for missing required fields (kept in required order for the clarification)
+        missing_fields = [f for f in required_fields if not extracted_fields.get(f)]
         
         # Check active tasks for missing context
         active_tasks = state_manager.get_active_tasks(intent.value)
         if active_tasks and missing_fields:
-            # Get missing fields from active task context
-            for task_id, task in active_tasks.items():
-                for field in missing_fields[:]:
-                    if field in task.data and task.data[field]:
-                        extracted_fields[field] = task.data[field]
-                        missing_fields.remove(field)
+            # Get missing fields from active task context, first task to have one wins
+            for task in active_tasks.values():
+                filled = [f for f in missing_fields if task.data.get(f)]
+                for field in filled:
+                    extracted_fields[field] = task.data[field]
+                if filled:
+                    missing_fields = [f for f in missing_fields if f not in filled]
         
         if missing_fields:
             # Generate clarification request
             clarification = self._generate_clarification(intent, missing_fields, extracted_fields)
             
             # Create or update task state
-            task_id = f"{intent.value}_{len(state_manager.active_tasks)}"
-            if not active_tasks:
-                state_manager.create_task(task_id, intent.value, extracted_fields)
-            else:
-                # Update existing
-                task_id = list(active_tasks.keys())[0]
+            task_id, _, created = state_manager.get_or_create_inflight(intent.value, extracted_fields)
+            if not created:
                 state_manager.update_task(task_id, **extracted_fields)
             
             return ValidationResult(
@@ -126,16 +121,8 @@ class ToolValidator:
         if not active_tasks:
             return None
         
-        # Get most recent task
-        recent_task = max(active_tasks.values(), key=lambda t: t.created_at)
-        task_id = None
-        for tid, task in active_tasks.items():
-            if task == recent_task:
-                task_id = tid
-                break
-        
-        if not task_id:
-            return None
+        # Get most recent task, keeping its id alongside
+        task_id, recent_task = max(active_tasks.items(), key=lambda item: item[1].created_at)
         
         # Extract missing fields from response
         intent = Intent(recent_task.task_type)
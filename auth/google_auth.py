@@ -5,8 +5,8 @@ Handles authentication flow for Gmail and Google Calendar APIs.
 
 import os
 import json
-import pickle
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -30,7 +30,8 @@ class GoogleAuthManager:
     def __init__(self):
         self.base_dir = Path(__file__).parent
         self.credentials_file = self.base_dir / 'credentials.json'
-        self.token_file = self.base_dir / 'token.pickle'
+        self.token_file = self.base_dir / 'token.json'
+        self.legacy_token_file = self.base_dir / 'token.pickle'
         self._credentials = None
         self._gmail_service = None
         self._calendar_service = None
@@ -77,9 +78,8 @@ class GoogleAuthManager:
         creds = None
         
         # Load existing token
-        if self.token_file.exists() and not force_reauth:
-            with open(self.token_file, 'rb') as token:
-                creds = pickle.load(token)
+        if not force_reauth:
+            creds = self._load_token()
         
         # If there are no (valid) credentials available, let the user log in
         if not creds or not creds.valid:
@@ -104,17 +104,38 @@ class GoogleAuthManager:
                 logging.info("✅ Completed Google OAuth2 authentication")
             
             # Save the credentials for the next run
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
+            self._save_token(creds)
         
         self._credentials = creds
         return True
     
+    def _load_token(self) -> Optional[Credentials]:
+        """Load stored credentials, migrating a legacy token.pickle to JSON."""
+        if self.token_file.exists():
+            return Credentials.from_authorized_user_info(
+                json.loads(self.token_file.read_text()), SCOPES
+            )
+        
+        if self.legacy_token_file.exists():
+            import pickle
+            with open(self.legacy_token_file, 'rb') as token:
+                creds = pickle.load(token)
+            self._save_token(creds)
+            self.legacy_token_file.unlink()
+            logging.info("✅ Migrated token.pickle to token.json")
+            return creds
+        
+        return None
+    
+    def _save_token(self, creds: Credentials):
+        """Persist credentials as authorized-user JSON."""
+        self.token_file.write_text(creds.to_json())
+    
     def get_gmail_service(self):
         """Get authenticated Gmail API service."""
         if not self._gmail_service and self._credentials:
             try:
-                self._gmail_service = build('gmail', 'v1', credentials=self._credentials)
+                self._gmail_service = build('gmail', 'v1', credentials=self._credentials, cache_discovery=False)
                 logging.info("✅ Gmail API service initialized")
             except Exception as e:
                 logging.error(f"❌ Failed to initialize Gmail service: {e}")
@@ -124,7 +145,7 @@ class GoogleAuthManager:
         """Get authenticated Google Calendar API service."""
         if not self._calendar_service and self._credentials:
             try:
-                self._calendar_service = build('calendar', 'v3', credentials=self._credentials)
+                self._calendar_service = build('calendar', 'v3', credentials=self._credentials, cache_discovery=False)
                 logging.info("✅ Google Calendar API service initialized")
             except Exception as e:
                 logging.error(f"❌ Failed to initialize Calendar service: {e}")
@@ -137,8 +158,9 @@ class GoogleAuthManager:
     def revoke_access(self) -> bool:
         """Revoke access and remove stored tokens."""
         try:
-            if self.token_file.exists():
-                os.remove(self.token_file)
+            for token_file in (self.token_file, self.legacy_token_file):
+                if token_file.exists():
+                    os.remove(token_file)
             
             if self._credentials:
                 # Revoke the token
@@ -154,6 +176,24 @@ class GoogleAuthManager:
             logging.error(f"❌ Error revoking access: {e}")
             return False
     
+    def _test_gmail(self) -> bool:
+        """Make a lightweight Gmail API call."""
+        gmail_service = self.get_gmail_service()
+        if not gmail_service:
+            return False
+        profile = gmail_service.users().getProfile(userId='me').execute()
+        logging.info(f"✅ Gmail API test successful for {profile.get('emailAddress')}")
+        return True
+    
+    def _test_calendar(self) -> bool:
+        """Make a lightweight Calendar API call."""
+        calendar_service = self.get_calendar_service()
+        if not calendar_service:
+            return False
+        calendars = calendar_service.calendarList().list().execute()
+        logging.info(f"✅ Calendar API test successful, found {len(calendars.get('items', []))} calendars")
+        return True
+    
     def test_connection(self) -> dict:
         """Test connections to Gmail and Calendar APIs."""
         results = {
@@ -166,27 +206,17 @@ class GoogleAuthManager:
             results['errors'].append("Not authenticated")
             return results
         
-        # Test Gmail API
-        try:
-            gmail_service = self.get_gmail_service()
-            if gmail_service:
-                profile = gmail_service.users().getProfile(userId='me').execute()
-                results['gmail'] = True
-                logging.info(f"✅ Gmail API test successful for {profile.get('emailAddress')}")
-        except Exception as e:
-            results['errors'].append(f"Gmail API error: {e}")
-            logging.error(f"❌ Gmail API test failed: {e}")
+        # Gmail and Calendar use separate HTTP clients, so check them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gmail_future = executor.submit(self._test_gmail)
+            calendar_future = executor.submit(self._test_calendar)
         
-        # Test Calendar API
-        try:
-            calendar_service = self.get_calendar_service()
-            if calendar_service:
-                calendars = calendar_service.calendarList().list().execute()
-                results['calendar'] = True
-                logging.info(f"✅ Calendar API test successful, found {len(calendars.get('items', []))} calendars")
-        except Exception as e:
-            results['errors'].append(f"Calendar API error: {e}")
-            logging.error(f"❌ Calendar API test failed: {e}")
+        for api, label, future in (('gmail', 'Gmail', gmail_future), ('calendar', 'Calendar', calendar_future)):
+            try:
+                results[api] = future.result()
+            except Exception as e:
+                results['errors'].append(f"{label} API error: {e}")
+                logging.error(f"❌ {label} API test failed: {e}")
         
         return results
 
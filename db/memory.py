@@ -1,99 +1,362 @@
-import chromadb
-from chromadb.config import Settings
 import os
 import json
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional
+import time
+import atexit
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
-from .models import get_session, Conversation, User, SearchHistory, TaskHistory
+from .models import (
+    get_session, get_write_session, Conversation, User, SearchHistory, TaskHistory,
+    ToolSelection, TOOL_SELECTION_BY_COMMAND
+)
 import hashlib
 
+try:
+    import orjson  # optional, faster tools_used (de)serialization
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Built once so SQLAlchemy reuses the compiled SQL for recent-history reads
+RECENT_CONVERSATIONS = select(
+    Conversation.user_message,
+    Conversation.assistant_response,
+    Conversation.tools_used,
+    Conversation.created_at,
+    Conversation.session_id
+).where(
+    Conversation.user_id == bindparam('user_id')
+).order_by(
+    Conversation.created_at.desc()
+).limit(bindparam('limit'))
+RECENT_SESSION_CONVERSATIONS = RECENT_CONVERSATIONS.where(
+    Conversation.session_id == bindparam('session_id')
+)
+
+def _knowledge_id(content: str) -> str:
+    """Stable Chroma id for a knowledge document, derived from its content."""
+    return f"knowledge_{hashlib.blake2b(content.encode(), digest_size=16).hexdigest()}"
+
 # Suppress ChromaDB warnings
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 logging.getLogger("chromadb").setLevel(logging.WARNING)
 
+# get_context_for_query cache: entries expire after this many seconds
+CONTEXT_CACHE_TTL = 300
+CONTEXT_CACHE_SIZE = 256
+
+# Recently embedded query strings kept in memory
+EMBEDDING_CACHE_SIZE = 2048
+
+# Conversations are inserted and embedded in batches by a background thread
+CHROMA_FLUSH_BATCH = 64
+CHROMA_FLUSH_INTERVAL = 2.0  # seconds
+
+# Search/task history rows are buffered and inserted by the same thread
+HISTORY_FLUSH_BATCH = 32
+
+# Stored tool selections are re-derived by the LLM after this long
+TOOL_SELECTION_TTL = timedelta(days=7)
+
 class MemorySystem:
     """Hybrid memory system using Chroma and SQL."""
     
     def __init__(self, user_id: int = 1):
         self.user_id = user_id
+        # normalized query -> (monotonic time, context), cleared on every write
+        self._context_cache: Dict[str, tuple] = {}
+        # Held for eviction and clears; the flusher thread clears the cache too
+        self._context_lock = threading.Lock()
+        # conversation rows waiting for the background writer
+        self._pending_conversations = deque()
+        # (table, row) waiting to be inserted into SQL
+        self._pending_history = deque()
+        self._flush_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._flusher = None
+        self._search_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="memory-search")
         
-        # Initialize Chroma
-        chroma_path = os.path.join(os.path.dirname(__file__), "chroma_db")
-        os.makedirs(chroma_path, exist_ok=True)
-        
-        try:
-            # Configure ChromaDB settings
-            chroma_settings = Settings(
-                allow_reset=True,
-                anonymized_telemetry=False
-            )
-            
-            self.chroma_client = chromadb.PersistentClient(
-                path=chroma_path,
-                settings=chroma_settings
-            )
+        # Chroma (and its embedding runtime) is loaded on first vector use
+        self._chroma_lock = threading.Lock()
+        self._chroma_ready = False
+        self._chroma_client = None
+        self._conversations_collection = None
+        self._knowledge_collection = None
+        self._ef = None
+        self._embed = functools.lru_cache(maxsize=EMBEDDING_CACHE_SIZE)(self._embed_query)
+    
+    def _init_chroma(self):
+        """Import chromadb and open the persistent collections."""
+        with self._chroma_lock:
+            if self._chroma_ready:
+                return
             
-            # Create collections with error handling
-            self.conversations_collection = self.chroma_client.get_or_create_collection(
-                name="conversations",
-                metadata={"hnsw:space": "cosine"}
-            )
+            chroma_path = os.path.join(os.path.dirname(__file__), "chroma_db")
+            os.makedirs(chroma_path, exist_ok=True)
             
-            self.knowledge_collection = self.chroma_client.get_or_create_collection(
-                name="knowledge", 
-                metadata={"hnsw:space": "cosine"}
-            )
-        except Exception as e:
-            logging.warning(f"ChromaDB initialization warning: {e}")
-            # Create minimal fallback
-            self.chroma_client = None
-            self.conversations_collection = None
-            self.knowledge_collection = None
+            try:
+                import chromadb
+                from chromadb.config import Settings
+                from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+                
+                # Configure ChromaDB settings
+                chroma_settings = Settings(
+                    allow_reset=True,
+                    anonymized_telemetry=False
+                )
+                
+                self._chroma_client = chromadb.PersistentClient(
+                    path=chroma_path,
+                    settings=chroma_settings
+                )
+                # Shared with the collections so queries can be embedded up front
+                self._ef = DefaultEmbeddingFunction()
+                
+                # Create collections with error handling
+                self._conversations_collection = self._chroma_client.get_or_create_collection(
+                    name="conversations",
+                    metadata={"hnsw:space": "cosine"},
+                    embedding_function=self._ef
+                )
+                
+                self._knowledge_collection = self._chroma_client.get_or_create_collection(
+                    name="knowledge", 
+                    metadata={"hnsw:space": "cosine"},
+                    embedding_function=self._ef
+                )
+            except Exception as e:
+                logging.warning(f"ChromaDB initialization warning: {e}")
+                # Create minimal fallback
+                self._chroma_client = None
+                self._conversations_collection = None
+                self._knowledge_collection = None
+                self._ef = None
+            self._chroma_ready = True
+    
+    def warm_up(self):
+        """Open Chroma and load the embedding model ahead of the first search or flush."""
+        if not self._chroma_ready:
+            self._init_chroma()
+        if self._ef is not None:
+            # The ONNX session is only created on the first embedding call
+            self._ef(["warm up"])
+    
+    def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text with the memory model (cached); None if Chroma is unavailable."""
+        if not self._chroma_ready:
+            self._init_chroma()
+        if self._ef is None:
+            return None
+        return self._embed(text)
+    
+    def _embed_query(self, query: str):
+        """Embed a query string; called through the self._embed LRU cache."""
+        return self._ef([query])[0]
+    
+    @property
+    def chroma_client(self):
+        if not self._chroma_ready:
+            self._init_chroma()
+        return self._chroma_client
+    
+    @property
+    def conversations_collection(self):
+        if not self._chroma_ready:
+            self._init_chroma()
+        return self._conversations_collection
+    
+    @property
+    def knowledge_collection(self):
+        if not self._chroma_ready:
+            self._init_chroma()
+        return self._knowledge_collection
     
     def store_conversation(self, session_id: str, user_message: str, assistant_response: str, tools_used: List[str] = None):
-        """Store a conversation in both PostgreSQL and Chroma for vector search."""
-        db_session = get_session()
+        """Queue a conversation for PostgreSQL and Chroma.
         
+        The background writer inserts the row and indexes it for vector
+        search, so the caller does not wait on a commit or the embedding model.
+        """
+        tools_json = _dumps(tools_used) if tools_used else None
+        row = {
+            "user_id": self.user_id,
+            "session_id": session_id,
+            "user_message": user_message,
+            "assistant_response": assistant_response,
+            "tools_used": tools_json,
+            "created_at": datetime.utcnow()
+        }
+        self._pending_conversations.append(row)
+        self._start_flusher()
+        if len(self._pending_conversations) >= CHROMA_FLUSH_BATCH:
+            self._flush_wakeup.set()
+    
+    def _start_flusher(self):
+        """Start the background writer on first use."""
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, name="chroma-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush_pending)
+    
+    def _flush_loop(self):
+        while True:
+            self._flush_wakeup.wait(CHROMA_FLUSH_INTERVAL)
+            self._flush_wakeup.clear()
+            try:
+                self.flush_pending()
+            except Exception:
+                logging.exception("❌ Background memory flush failed")
+    
+    def flush_pending(self):
+        """Write queued history rows and conversation embeddings now."""
+        with self._flush_lock:
+            if self._pending_history:
+                self._flush_history()
+            if self._pending_conversations:
+                self._flush_conversations()
+    
+    def _queue_history(self, table, row: Dict):
+        """Queue a history row for the background writer."""
+        self._pending_history.append((table, row))
+        self._start_flusher()
+        if len(self._pending_history) >= HISTORY_FLUSH_BATCH:
+            self._flush_wakeup.set()
+    
+    def _flush_history(self):
+        """Insert queued history rows with one executemany per table."""
+        rows_by_table = {}
+        while self._pending_history:
+            table, row = self._pending_history.popleft()
+            rows_by_table.setdefault(table, []).append(row)
+        
+        db_session = None
         try:
-            # Store in PostgreSQL
-            conversation = Conversation(
-                user_id=self.user_id,
-                session_id=session_id,
-                user_message=user_message,
-                assistant_response=assistant_response,
-                tools_used=json.dumps(tools_used) if tools_used else None
-            )
-            db_session.add(conversation)
+            db_session = get_write_session()
+            for table, rows in rows_by_table.items():
+                db_session.execute(table.insert(), rows)
             db_session.commit()
-            
-            # Store in Chroma for vector search
-            conversation_text = f"User: {user_message}\nAssistant: {assistant_response}"
-            document_id = f"conv_{conversation.id}"
-            
-            self.conversations_collection.add(
-                documents=[conversation_text],
-                metadatas=[{
-                    "user_id": str(self.user_id),
-                    "session_id": session_id,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "tools_used": json.dumps(tools_used) if tools_used else "[]",
-                    "conversation_id": conversation.id
-                }],
-                ids=[document_id]
-            )
-            
+            return
         except Exception as e:
-            db_session.rollback()
-            raise e
+            if db_session is not None:
+                db_session.rollback()
+            logging.error(f"Failed to store history rows as a batch, retrying one by one: {e}")
         finally:
-            db_session.close()
+            if db_session is not None:
+                db_session.close()
+        
+        # One bad row shouldn't lose the rest of the batch
+        total = sum(len(rows) for rows in rows_by_table.values())
+        stored = 0
+        for table, rows in rows_by_table.items():
+            for row in rows:
+                db_session = None
+                try:
+                    db_session = get_write_session()
+                    db_session.execute(table.insert(), row)
+                    db_session.commit()
+                    stored += 1
+                except Exception as e:
+                    if db_session is not None:
+                        db_session.rollback()
+                    logging.error(f"Failed to store {table.name} row: {e}")
+                finally:
+                    if db_session is not None:
+                        db_session.close()
+        if stored < total:
+            logging.error(f"Lost {total - stored} of {total} history rows")
+    
+    def _insert_conversations(self, rows: List[Dict]) -> Tuple[List[Dict], List[int]]:
+        """Insert conversation rows; returns the stored rows and their ids."""
+        db_session = None
+        try:
+            db_session = get_write_session()
+            conversation_ids = db_session.scalars(
+                insert(Conversation).returning(Conversation.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+            db_session.commit()
+            return rows, conversation_ids
+        except Exception as e:
+            if db_session is not None:
+                db_session.rollback()
+            logging.error(f"Failed to store {len(rows)} conversations as a batch, retrying one by one: {e}")
+        finally:
+            if db_session is not None:
+                db_session.close()
+        
+        # One bad row shouldn't lose the rest of the batch
+        stored_rows, conversation_ids = [], []
+        for row in rows:
+            db_session = None
+            try:
+                db_session = get_write_session()
+                conversation_ids.append(db_session.scalar(
+                    insert(Conversation).values(**row).returning(Conversation.id)
+                ))
+                db_session.commit()
+                stored_rows.append(row)
+            except Exception as e:
+                if db_session is not None:
+                    db_session.rollback()
+                logging.error(f"Failed to store conversation: {e}")
+            finally:
+                if db_session is not None:
+                    db_session.close()
+        if len(stored_rows) < len(rows):
+            logging.error(f"Lost {len(rows) - len(stored_rows)} of {len(rows)} conversations")
+        return stored_rows, conversation_ids
+    
+    def _flush_conversations(self):
+        """Insert queued conversations, then add them to Chroma, in batches."""
+        while self._pending_conversations:
+            rows = []
+            while self._pending_conversations and len(rows) < CHROMA_FLUSH_BATCH:
+                rows.append(self._pending_conversations.popleft())
+            
+            rows, conversation_ids = self._insert_conversations(rows)
+            if not rows:
+                continue
+            
+            try:
+                self.conversations_collection.add(
+                    documents=[
+                        f"User: {row['user_message']}\nAssistant: {row['assistant_response']}"
+                        for row in rows
+                    ],
+                    metadatas=[
+                        {
+                            "user_id": str(row["user_id"]),
+                            "session_id": row["session_id"],
+                            "timestamp": row["created_at"].isoformat(),
+                            "tools_used": row["tools_used"] or "[]",
+                            "conversation_id": conversation_id
+                        }
+                        for row, conversation_id in zip(rows, conversation_ids)
+                    ],
+                    ids=[f"conv_{conversation_id}" for conversation_id in conversation_ids]
+                )
+            except Exception as e:
+                logging.warning(f"Failed to index {len(rows)} conversations in Chroma: {e}")
+        self._clear_context_cache()
     
     def store_knowledge(self, content: str, source: str, category: str = "general"):
         """Store knowledge from web searches, emails, etc."""
-        content_hash = hashlib.md5(content.encode()).hexdigest()
-        document_id = f"knowledge_{content_hash}"
+        document_id = _knowledge_id(content)
+        self._clear_context_cache()
         
         try:
             self.knowledge_collection.add(
@@ -121,6 +384,44 @@ class MemorySystem:
             except:
                 pass  # Ignore if can't update
     
+    def store_knowledge_bulk(self, items: List[Dict]):
+        """Store several knowledge items with one embedding pass.
+        
+        Each item is a dict with "content", "source" and optional "category".
+        """
+        if not items or not self.knowledge_collection:
+            return
+        self._clear_context_cache()
+        
+        timestamp = datetime.utcnow().isoformat()
+        documents = {}
+        for item in items:
+            documents[_knowledge_id(item["content"])] = (item["content"], {
+                "user_id": str(self.user_id),
+                "source": item["source"],
+                "category": item.get("category", "general"),
+                "timestamp": timestamp
+            })
+        
+        try:
+            existing = set(self.knowledge_collection.get(ids=list(documents), include=[])["ids"])
+            new_ids = [document_id for document_id in documents if document_id not in existing]
+            if new_ids:
+                self.knowledge_collection.add(
+                    documents=[documents[document_id][0] for document_id in new_ids],
+                    metadatas=[documents[document_id][1] for document_id in new_ids],
+                    ids=new_ids
+                )
+            if existing:
+                # Already stored: refresh metadata only, like store_knowledge
+                existing_ids = list(existing)
+                self.knowledge_collection.update(
+                    ids=existing_ids,
+                    metadatas=[documents[document_id][1] for document_id in existing_ids]
+                )
+        except Exception as e:
+            logging.warning(f"Failed to store {len(documents)} knowledge items: {e}")
+    
     def search_conversations(self, query: str, limit: int = 5) -> List[Dict]:
         """Search past conversations for relevant context."""
         if not self.conversations_collection:
@@ -128,26 +429,25 @@ class MemorySystem:
             
         try:
             results = self.conversations_collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed(query)],
                 n_results=limit,
                 where={"user_id": str(self.user_id)}
             )
             
-            formatted_results = []
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
-            )):
-                formatted_results.append({
+            return [
+                {
                     "content": doc,
                     "timestamp": metadata.get("timestamp"),
                     "session_id": metadata.get("session_id"),
-                    "tools_used": json.loads(metadata.get("tools_used", "[]")),
+                    "tools_used": _loads(metadata.get("tools_used", "[]")),
                     "relevance_score": 1 - distance  # Convert distance to similarity
-                })
-            
-            return formatted_results
+                }
+                for doc, metadata, distance in zip(
+                    results['documents'][0],
+                    results['metadatas'][0],
+                    results['distances'][0]
+                )
+            ]
         except Exception as e:
             print(f"Error searching conversations: {e}")
             return []
@@ -163,57 +463,67 @@ class MemorySystem:
                 where_clause["category"] = category
             
             results = self.knowledge_collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed(query)],
                 n_results=limit,
                 where=where_clause
             )
             
-            formatted_results = []
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
-            )):
-                formatted_results.append({
+            return [
+                {
                     "content": doc,
                     "source": metadata.get("source"),
                     "category": metadata.get("category"),
                     "timestamp": metadata.get("timestamp"),
                     "relevance_score": 1 - distance
-                })
-            
-            return formatted_results
+                }
+                for doc, metadata, distance in zip(
+                    results['documents'][0],
+                    results['metadatas'][0],
+                    results['distances'][0]
+                )
+            ]
         except Exception as e:
             print(f"Error searching knowledge: {e}")
             return []
     
+    def search_all(self, query: str, conversation_limit: int = 3, knowledge_limit: int = 3) -> Tuple[List[Dict], List[Dict]]:
+        """Search conversations and knowledge concurrently."""
+        if self.knowledge_collection:
+            try:
+                self._embed(query)  # embed once; both searches then hit the cache
+            except Exception:
+                pass  # each search reports its own failure
+        conv_future = self._search_pool.submit(self.search_conversations, query, conversation_limit)
+        knowledge_results = self.search_knowledge(query, limit=knowledge_limit)
+        return conv_future.result(), knowledge_results
+    
     def get_recent_conversations(self, session_id: str = None, limit: int = 10) -> List[Dict]:
         """Get recent conversations from PostgreSQL."""
+        if self._pending_conversations:
+            # Include conversations still waiting for the background writer
+            self.flush_pending()
         db_session = get_session()
         
         try:
-            query = db_session.query(Conversation).filter(
-                Conversation.user_id == self.user_id
-            )
-            
             if session_id:
-                query = query.filter(Conversation.session_id == session_id)
-            
-            conversations = query.order_by(
-                Conversation.created_at.desc()
-            ).limit(limit).all()
-            
-            result = []
-            for conv in conversations:
-                result.append({
-                    "user_message": conv.user_message,
-                    "assistant_response": conv.assistant_response,
-                    "tools_used": json.loads(conv.tools_used) if conv.tools_used else [],
-                    "timestamp": conv.created_at.isoformat(),
-                    "session_id": conv.session_id
+                rows = db_session.execute(RECENT_SESSION_CONVERSATIONS, {
+                    "user_id": self.user_id, "session_id": session_id, "limit": limit
+                })
+            else:
+                rows = db_session.execute(RECENT_CONVERSATIONS, {
+                    "user_id": self.user_id, "limit": limit
                 })
             
-            return result
+            return [
+                {
+                    "user_message": user_message,
+                    "assistant_response": assistant_response,
+                    "tools_used": _loads(tools_used) if tools_used else [],
+                    "timestamp": created_at.isoformat(),
+                    "session_id": session_id
+                }
+                for user_message, assistant_response, tools_used, created_at, session_id in rows
+            ]
         except Exception as e:
             print(f"Error getting recent conversations: {e}")
             return []
@@ -222,16 +532,13 @@ class MemorySystem:
     
     def store_search_history(self, query: str, results_summary: str):
         """Store web search history."""
-        db_session = get_session()
-        
         try:
-            search_record = SearchHistory(
-                user_id=self.user_id,
-                query=query,
-                results_summary=results_summary
-            )
-            db_session.add(search_record)
-            db_session.commit()
+            self._queue_history(SearchHistory.__table__, {
+                "user_id": self.user_id,
+                "query": query,
+                "results_summary": results_summary,
+                "created_at": datetime.utcnow()
+            })
             
             # Also store in knowledge base
             self.store_knowledge(
@@ -240,45 +547,84 @@ class MemorySystem:
                 category="search"
             )
         except Exception as e:
-            db_session.rollback()
             print(f"Error storing search history: {e}")
-        finally:
-            db_session.close()
     
     def store_task_history(self, task_type: str, command: str, result: str, success: bool):
         """Store task execution history."""
+        self._queue_history(TaskHistory.__table__, {
+            "user_id": self.user_id,
+            "task_type": task_type,
+            "command": command,
+            "result": result,
+            "success": success,
+            "created_at": datetime.utcnow()
+        })
+    
+    def get_tool_selection(self, command: str) -> Optional[Dict]:
+        """Look up a stored tool selection for a normalized command."""
         db_session = get_session()
-        
         try:
-            task_record = TaskHistory(
-                user_id=self.user_id,
-                task_type=task_type,
-                command=command,
-                result=result,
-                success=success
-            )
-            db_session.add(task_record)
+            since = datetime.utcnow() - TOOL_SELECTION_TTL
+            tool_call = db_session.execute(
+                TOOL_SELECTION_BY_COMMAND, {"command": command, "since": since}
+            ).scalar()
+            return _loads(tool_call) if tool_call else None
+        except Exception as e:
+            logging.warning(f"Failed to read tool selection: {e}")
+            return None
+        finally:
+            db_session.close()
+    
+    def store_tool_selection(self, command: str, tool_call: Dict):
+        """Persist a tool selection so it survives restarts (replacing any stored one)."""
+        db_session = get_write_session()
+        try:
+            values = {"tool_call": _dumps(tool_call), "created_at": datetime.utcnow()}
+            updated = db_session.execute(
+                update(ToolSelection).where(ToolSelection.command == command).values(**values)
+            ).rowcount
+            if not updated:
+                db_session.add(ToolSelection(command=command, **values))
             db_session.commit()
         except Exception as e:
             db_session.rollback()
-            print(f"Error storing task history: {e}")
+            logging.warning(f"Failed to store tool selection: {e}")
         finally:
             db_session.close()
     
     def get_context_for_query(self, query: str) -> str:
         """Get relevant context from memory for a query."""
+        cache_key = query.strip().lower()
+        cached = self._context_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CONTEXT_CACHE_TTL:
+            return cached[1]
+        
+        context = self._build_context(query)
+        with self._context_lock:
+            if len(self._context_cache) >= CONTEXT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._context_cache.pop(next(iter(self._context_cache)), None)
+            self._context_cache[cache_key] = (time.monotonic(), context)
+        return context
+    
+    def _clear_context_cache(self):
+        with self._context_lock:
+            self._context_cache.clear()
+    
+    def _build_context(self, query: str) -> str:
+        """Run the vector searches behind get_context_for_query."""
         context_parts = []
         
-        # Search conversations
-        conv_results = self.search_conversations(query, limit=3)
+        conv_results, knowledge_results = self.search_all(query, conversation_limit=3, knowledge_limit=2)
+        
+        # Relevant conversations
         if conv_results:
             context_parts.append("## Relevant Past Conversations:")
             for result in conv_results:
                 if result["relevance_score"] > 0.7:  # Only include highly relevant results
                     context_parts.append(f"- {result['content'][:200]}...")
         
-        # Search knowledge
-        knowledge_results = self.search_knowledge(query, limit=2)
+        # Relevant knowledge
         if knowledge_results:
             context_parts.append("## Relevant Knowledge:")
             for result in knowledge_results:
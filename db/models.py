@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import create_engine, event, inspect, select, bindparam, Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+import atexit
 import os
 from dotenv import load_dotenv
 
@@ -21,10 +22,15 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Relationships
-    conversations = relationship("Conversation", back_populates="user")
-    calendar_events = relationship("CalendarEvent", back_populates="user")
-    email_summaries = relationship("EmailSummary", back_populates="user")
+    # Relationships (never lazy-loaded; query the child tables directly)
+    conversations = relationship("Conversation", back_populates="user", lazy='raise')
+    calendar_events = relationship("CalendarEvent", back_populates="user", lazy='raise')
+    email_summaries = relationship("EmailSummary", back_populates="user", lazy='raise')
+
+# Default-user probe; built once so the compiled SQL is cached
+USER_BY_ID = select(
+    User.id, User.name, User.preferred_location, User.timezone
+).where(User.id == bindparam('user_id'))
 
 class Conversation(Base):
     """Store conversation history for context."""
@@ -40,6 +46,12 @@ class Conversation(Base):
     
     # Relationships
     user = relationship("User", back_populates="conversations")
+    
+    # Recent-history lookups, with and without a session filter
+    __table_args__ = (
+        Index('ix_conv_user_created', 'user_id', 'created_at'),
+        Index('ix_conv_user_session_created', 'user_id', 'session_id', 'created_at'),
+    )
 
 class CalendarEvent(Base):
     """Cache calendar events locally."""
@@ -59,6 +71,10 @@ class CalendarEvent(Base):
     
     # Relationships
     user = relationship("User", back_populates="calendar_events")
+    
+    __table_args__ = (
+        Index('ix_cal_user_start', 'user_id', 'start_time'),
+    )
 
 class EmailSummary(Base):
     """Cache email summaries and important information."""
@@ -77,6 +93,10 @@ class EmailSummary(Base):
     
     # Relationships
     user = relationship("User", back_populates="email_summaries")
+    
+    __table_args__ = (
+        Index('ix_email_user_received', 'user_id', 'received_at'),
+    )
 
 class SearchHistory(Base):
     """Track web searches for learning user interests."""
@@ -87,6 +107,10 @@ class SearchHistory(Base):
     query = Column(Text, nullable=False)
     results_summary = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_search_user_created', 'user_id', 'created_at'),
+    )
 
 class TaskHistory(Base):
     """Track completed tasks and commands."""
@@ -99,6 +123,25 @@ class TaskHistory(Base):
     result = Column(Text)
     success = Column(Boolean, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_task_user_created', 'user_id', 'created_at'),
+    )
+
+class ToolSelection(Base):
+    """Parsed tool selections, keyed by normalized command."""
+    __tablename__ = 'tool_selections'
+    
+    id = Column(Integer, primary_key=True)
+    command = Column(Text, unique=True, nullable=False)
+    tool_call = Column(Text, nullable=False)  # JSON {"tool": ..., "parameters": {...}}
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+# Entries older than `since` are ignored (and overwritten on the next store)
+TOOL_SELECTION_BY_COMMAND = select(ToolSelection.tool_call).where(
+    ToolSelection.command == bindparam('command'),
+    ToolSelection.created_at >= bindparam('since')
+)
 
 # Database connection
 def get_database_url():
@@ -111,14 +154,102 @@ def get_database_url():
         db_path = os.path.join(os.path.dirname(__file__), 'jarvis.db')
         return f'sqlite:///{db_path}'
 
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=2147483648",
+    "PRAGMA busy_timeout=5000",
+)
+
+SQLITE_CONNECT_ARGS = {"check_same_thread": False, "cached_statements": 512}
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see _begin_sqlite) instead of pysqlite
+    dbapi_connection.isolation_level = None
+
+def _begin_sqlite(connection):
+    # Writers take the write lock up front so a batch never hits SQLITE_BUSY
+    # upgrading a deferred transaction; WAL readers are not blocked
+    if connection.get_execution_options().get('sqlite_immediate'):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        connection.exec_driver_sql("BEGIN")
+
+def _optimize_sqlite(dbapi_connection, connection_record):
+    # Refresh query-planner statistics before the connection goes away
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA analysis_limit=400")
+    cursor.execute("PRAGMA optimize")
+    cursor.close()
+
+# Created once by create_engine_and_tables() and shared by all sessions
+_engine = None
+_session_factory = None
+_write_session_factory = None
+
+def _create_missing_indexes(engine):
+    """Add indexes defined after a table was created (create_all skips existing tables)."""
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if not table.indexes:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(engine)
+
 def create_engine_and_tables():
-    """Create database engine and tables."""
-    engine = create_engine(get_database_url())
-    Base.metadata.create_all(engine)
+    """Create database engine and tables (once per process)."""
+    global _engine
+    if _engine is not None:
+        return _engine
+    
+    db_url = get_database_url()
+    if db_url.startswith('sqlite'):
+        # Pooled connections are shared with the background writer thread, and a
+        # larger statement cache keeps the per-batch inserts prepared
+        engine = create_engine(db_url, connect_args=SQLITE_CONNECT_ARGS)
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+        event.listen(engine, "begin", _begin_sqlite)
+        event.listen(engine, "close", _optimize_sqlite)
+        # Close pooled connections (running PRAGMA optimize) at exit
+        atexit.register(engine.dispose)
+    else:
+        # Drop connections the server closed while idle instead of failing a query
+        engine = create_engine(db_url, pool_pre_ping=True)
+    # One table-list query on an existing database instead of a check per table
+    if not set(Base.metadata.tables).issubset(inspect(engine).get_table_names()):
+        Base.metadata.create_all(engine)
+    _create_missing_indexes(engine)
+    _engine = engine
     return engine
 
 def get_session():
     """Get database session."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=create_engine_and_tables(), expire_on_commit=False)
+    return _session_factory()
+
+def get_write_session():
+    """Get database session whose transactions take the SQLite write lock up front."""
+    global _write_session_factory
+    if _write_session_factory is None:
+        writer = create_engine_and_tables().execution_options(sqlite_immediate=True)
+        _write_session_factory = sessionmaker(bind=writer, expire_on_commit=False)
+    return _write_session_factory()
+
+def checkpoint_database():
+    """Fold the SQLite write-ahead log back into the database file."""
     engine = create_engine_and_tables()
-    Session = sessionmaker(bind=engine)
-    return Session()
\ No newline at end of file
+    if engine.dialect.name != 'sqlite':
+        return
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
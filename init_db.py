@@ -8,12 +8,19 @@ import os
 import sys
 from datetime import datetime
 from dotenv import load_dotenv
+from sqlalchemy import insert
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from db.models import create_engine_and_tables, get_session, User
-from db.memory import MemorySystem
+from db.models import create_engine_and_tables, get_session, User, USER_BY_ID
+from db.memory import memory_system
+
+def seed_rows(session, model, rows):
+    """Insert seed rows with one executemany, skipping per-object ORM bookkeeping."""
+    if rows:
+        session.execute(insert(model), rows)
+        session.commit()
 
 def init_database():
     """Initialize the database with tables and default data."""
@@ -29,19 +36,18 @@ def init_database():
         # Create default user if it doesn't exist
         session = get_session()
         try:
-            existing_user = session.query(User).filter_by(id=1).first()
+            existing_user = session.execute(USER_BY_ID, {"user_id": 1}).first()
             
             if not existing_user:
-                default_user = User(
-                    id=1,
-                    name=os.getenv('USER_NAME', 'User'),
-                    email=os.getenv('EMAIL_ADDRESS', 'user@example.com'),
-                    preferred_location=os.getenv('DEFAULT_LOCATION', 'New York, NY'),
-                    timezone=os.getenv('TIMEZONE', 'America/New_York')
-                )
-                session.add(default_user)
-                session.commit()
-                print(f"✅ Created default user: {default_user.name}")
+                default_user = {
+                    "id": 1,
+                    "name": os.getenv('USER_NAME', 'User'),
+                    "email": os.getenv('EMAIL_ADDRESS', 'user@example.com'),
+                    "preferred_location": os.getenv('DEFAULT_LOCATION', 'New York, NY'),
+                    "timezone": os.getenv('TIMEZONE', 'America/New_York')
+                }
+                seed_rows(session, User, [default_user])
+                print(f"✅ Created default user: {default_user['name']}")
             else:
                 print(f"✅ Default user already exists: {existing_user.name}")
         
@@ -50,7 +56,6 @@ def init_database():
         
         # Initialize Chroma vector database
         print("🧠 Initializing vector memory system...")
-        memory_system = MemorySystem(user_id=1)
         
         # Store initial knowledge
         initial_knowledge = [
@@ -66,12 +71,7 @@ def init_database():
             }
         ]
         
-        for knowledge in initial_knowledge:
-            memory_system.store_knowledge(
-                content=knowledge["content"],
-                source=knowledge["source"],
-                category=knowledge["category"]
-            )
+        memory_system.store_knowledge_bulk(initial_knowledge)
         
         print("✅ Vector memory system initialized")
         
@@ -1,5 +1,9 @@
 import os
+import re
+import json
 import logging
+import queue
+import threading
 import time
 import traceback
 import uuid
@@ -7,18 +11,7 @@ from dotenv import load_dotenv
 
 from voice.stt import SpeechToText
 from voice.tts import TextToSpeech
-from tools.weather import get_current_weather_tool
-from tools.terminal import run_terminal_command_tool
-from tools.app_launcher import app_launcher_tool
-from tools.email import email_tool
-from tools.calendar import calendar_tool
-from tools.gmail_oauth import gmail_oauth_tool
-from tools.calendar_oauth import calendar_oauth_tool
-from tools.web_search import web_search_tool
-from tools.memory import smart_lookup_tool, recent_context_tool
-
-from langchain_ollama import ChatOllama
-from db.memory import memory_system
+from voice.wake_word import load_wake_word_detector
 
 load_dotenv()
 
@@ -26,27 +19,220 @@ load_dotenv()
 MIC_INDEX = 0
 TRIGGER_WORD = "jarvis"
 CONVERSATION_TIMEOUT = 30
+WAKE_WORD_PATTERN = re.compile(rf"\b{re.escape(TRIGGER_WORD)}\b", re.IGNORECASE)
+SHUTDOWN_PATTERN = re.compile(r"\bshut down\b", re.IGNORECASE)
 
-logging.basicConfig(level=logging.DEBUG)
+# Keep the model (and its cached prompt prefix) loaded between wake words
+LLM_MODEL = "qwen:latest"
+LLM_KEEP_ALIVE = "30m"
+
+# Tool selection only emits a small JSON object, so it runs on a smaller model
+TOOL_SELECTION_MODEL = os.getenv("TOOL_SELECTION_MODEL", "llama3.2")
+
+# Streamed replies are spoken one sentence at a time
+SENTENCE_BOUNDARY = re.compile(r'[.!?]\s+')
+
+# Spoken when the model picks a tool that isn't registered
+UNKNOWN_TOOL_MESSAGE = "Sorry, I don't have access to the '{}' function."
+
+# Parsed tool selections kept in memory (also persisted via db.memory)
+TOOL_SELECTION_CACHE_SIZE = 512
+TOOL_SELECTION_TTL = 7 * 24 * 3600  # seconds, as db.memory.TOOL_SELECTION_TTL
+
+# Selections for these are never cached: the model resolves them against the
+# current date/time ("tomorrow" -> a date), so a replay would be stale
+TIME_RELATIVE_PATTERN = re.compile(
+    r"\b(?:now|today|tonight|tomorrow|yesterday|ago|next|last|week(?:end)?|month|year|"
+    r"noon|midnight|(?:mon|tues|wednes|thurs|fri|satur|sun)days?|\d{1,2}(?::\d{2})?\s*[ap]\.?m)\b",
+    re.IGNORECASE,
+)
+TIME_PARAMETERS = frozenset({"date", "time", "days_ahead", "days_back"})
+
+logging.basicConfig(level=os.getenv("JARVIS_LOG", "INFO").upper())
 
 # Voice interface setup
 stt = SpeechToText(mic_index=MIC_INDEX)
 tts = TextToSpeech()
 
-# Language model
-llm = ChatOllama(model="qwen:latest")
-
-# Tool registry for direct execution
-TOOL_REGISTRY = {
-    "get_current_weather": get_current_weather_tool.func,
-    "run_terminal_command": run_terminal_command_tool.func,
-    "launch_application": app_launcher_tool.func,
-    "email_management": email_tool.func,
-    "calendar_management": calendar_tool.func,
-    "web_search": web_search_tool.func,
-    "search_memory": smart_lookup_tool.func,
-    "get_recent_context": recent_context_tool.func,
-}
+# The language model and tools (langchain, Chroma, Google clients) are loaded
+# on the first command, so idle wake-word listening only holds the voice stack
+_llm = None
+_tool_selection_chain = None
+_tool_registry = None
+
+def get_llm():
+    """Language model, created on first use."""
+    global _llm
+    if _llm is None:
+        from langchain_ollama import ChatOllama
+        _llm = ChatOllama(model=LLM_MODEL, keep_alive=LLM_KEEP_ALIVE)
+    return _llm
+
+def get_tool_selection_chain():
+    """Stage 1 prompt piped into a small, deterministic model, built on first use."""
+    global _tool_selection_chain
+    if _tool_selection_chain is None:
+        from langchain_core.messages import SystemMessage
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_ollama import ChatOllama
+        # The instructions are a fixed system message (a message object, so the
+        # JSON braces in it aren't template fields); only the command varies
+        prompt = ChatPromptTemplate.from_messages([
+            SystemMessage(content=TOOL_SELECTION_PROMPT),
+            ("human", 'User: "{command}"'),
+        ])
+        # JSON mode constrains decoding to a valid object; tool calls are short
+        llm = ChatOllama(
+            model=TOOL_SELECTION_MODEL,
+            format="json",
+            temperature=0,
+            num_predict=256,
+            keep_alive=LLM_KEEP_ALIVE
+        )
+        _tool_selection_chain = prompt | llm
+    return _tool_selection_chain
+
+def warm_llm():
+    """Load the models into Ollama in the background, so a command never waits on a cold start."""
+    def load():
+        try:
+            import ollama
+            # An empty prompt only loads the model (and resets its keep-alive timer)
+            for model in dict.fromkeys((TOOL_SELECTION_MODEL, LLM_MODEL)):
+                ollama.generate(model=model, prompt="", keep_alive=LLM_KEEP_ALIVE)
+        except Exception as e:
+            logging.warning(f"⚠️ LLM warm-up failed: {e}")
+    threading.Thread(target=load, daemon=True).start()
+
+def warm_tools():
+    """Import the tools and open Chroma (loading its embedding model) in the
+    background, so the first command's tool call doesn't wait on either."""
+    def load():
+        try:
+            get_tool_registry()
+            from db.memory import memory_system
+            memory_system.warm_up()
+        except Exception as e:
+            logging.warning(f"⚠️ Tool warm-up failed: {e}")
+    threading.Thread(target=load, daemon=True).start()
+
+def get_tool_registry() -> dict:
+    """Tool registry for direct execution, imported on first use."""
+    global _tool_registry
+    if _tool_registry is None:
+        from tools.weather import get_current_weather_tool
+        from tools.terminal import run_terminal_command_tool
+        from tools.app_launcher import app_launcher_tool
+        from tools.email import email_tool
+        from tools.calendar import calendar_tool
+        from tools.web_search import web_search_tool
+        from tools.memory import smart_lookup_tool, recent_context_tool
+        
+        _tool_registry = {
+            "get_current_weather": get_current_weather_tool.func,
+            "run_terminal_command": run_terminal_command_tool.func,
+            "launch_application": app_launcher_tool.func,
+            "email_management": email_tool.func,
+            "calendar_management": calendar_tool.func,
+            "web_search": web_search_tool.func,
+            "search_memory": smart_lookup_tool.func,
+            "get_recent_context": recent_context_tool.func,
+        }
+    return _tool_registry
+
+# Common commands routed straight to a tool call, without the LLM.
+# Matched against the command with whitespace collapsed and end punctuation stripped.
+# Names are one to three words; a conjunction, verb or time word in them
+# (a compound or forecast request) sends the command to the LLM instead.
+_APP_WORD = r"(?!(?:and|then|to|with|for|in|on|at|or|play|search|run)\b)[\w.+-]+"
+_CITY_WORD = r"(?!(?:and|then|on|at|this|next|tomorrow|tonight|today|now|right|later|weekend|week)\b)[\w.'-]+"
+FAST_PATH_ROUTES = [
+    (
+        re.compile(rf"^(?:please )?(?:open|launch) (?!(?:my|the|a|an|up)\b)(?P<app>{_APP_WORD}(?: {_APP_WORD}){{0,2}}?)(?: app)?$", re.IGNORECASE),
+        "launch_application",
+        lambda m: {"app_name": m["app"]},
+    ),
+    (
+        re.compile(rf"^(?:what(?:'s| is) the )?weather(?: like)? (?:in|for) (?P<city>{_CITY_WORD}(?: {_CITY_WORD}){{0,2}}?)(?: today| right now| now)?$", re.IGNORECASE),
+        "get_current_weather",
+        lambda m: {"city": m["city"]},
+    ),
+    (
+        re.compile(r"^(?:what(?:'s| is) the )?weather(?: like)?(?: today| right now| now| outside)?$", re.IGNORECASE),
+        "get_current_weather",
+        lambda m: {"city": "New York"},
+    ),
+    (
+        re.compile(r"^check (?:my )?e-?mails?$", re.IGNORECASE),
+        "email_management",
+        lambda m: {"action": "check", "limit": 5, "unread_only": True},
+    ),
+    (
+        re.compile(r"^list (?:the )?files$", re.IGNORECASE),
+        "run_terminal_command",
+        lambda m: {"command": "ls -la"},
+    ),
+]
+
+def route_command(command: str):
+    """Tool call for a command matching a fast-path route, or None."""
+    text = " ".join(command.split()).rstrip(".!?")
+    for pattern, tool_name, build_parameters in FAST_PATH_ROUTES:
+        match = pattern.match(text)
+        if match:
+            return {"tool": tool_name, "parameters": build_parameters(match)}
+    return None
+
+_tool_selection_cache = {}
+
+def normalize_command(command: str) -> str:
+    """Cache key for a command: lowercased, single-spaced, no trailing punctuation."""
+    return " ".join(command.lower().split()).rstrip(".!?")
+
+def get_cached_tool_call(key: str):
+    """Previously selected tool call for a normalized command, or None."""
+    entry = _tool_selection_cache.pop(key, None)
+    if entry is None or time.monotonic() - entry[0] > TOOL_SELECTION_TTL:
+        tool_call = None
+        try:
+            from db.memory import memory_system
+            tool_call = memory_system.get_tool_selection(key)
+        except Exception as e:
+            logging.warning(f"⚠️ Tool selection lookup failed: {e}")
+        if tool_call is None:
+            return None
+        entry = (time.monotonic(), tool_call)
+    # Re-inserting keeps the dict in least- to most-recently used order
+    _tool_selection_cache[key] = entry
+    if len(_tool_selection_cache) > TOOL_SELECTION_CACHE_SIZE:
+        _tool_selection_cache.pop(next(iter(_tool_selection_cache)))
+    return entry[1]
+
+def is_cacheable_tool_call(command: str, tool_call: dict, tool_result) -> bool:
+    """Whether replaying this tool call for the same command later is safe."""
+    if str(tool_result).startswith("❌"):
+        return False  # tools report failures as a returned "❌ ..." string
+    if TIME_PARAMETERS.intersection(tool_call["parameters"]):
+        return False
+    return not TIME_RELATIVE_PATTERN.search(command)
+
+def cache_tool_call(key: str, tool_call: dict):
+    """Remember a tool call that executed successfully."""
+    _tool_selection_cache.pop(key, None)
+    _tool_selection_cache[key] = (time.monotonic(), tool_call)
+    if len(_tool_selection_cache) > TOOL_SELECTION_CACHE_SIZE:
+        _tool_selection_cache.pop(next(iter(_tool_selection_cache)))
+    try:
+        from db.memory import memory_system
+        memory_system.store_tool_selection(key, tool_call)
+    except Exception as e:
+        logging.warning(f"⚠️ Failed to persist tool selection: {e}")
+
+def __getattr__(name):
+    # Keep `from main import llm` working without loading the model at import
+    if name == "llm":
+        return get_llm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Two-stage system prompts
 TOOL_SELECTION_PROMPT = """You are Jarvis, an AI assistant that selects tools to execute user commands.
@@ -100,63 +286,137 @@ TOOL RESULT: {tool_result}
 
 Provide a natural response based on the tool result:"""
 
+# What create_calendar_event reports after a Google Calendar insert (the
+# memory-only fallback says "Event created" and is left to the LLM)
+CALENDAR_CREATED_PATTERN = re.compile(
+    r"^✅ \*\*Calendar event created successfully:\*\* (?P<title>.+)\n"
+    r"📅 \*\*Date:\*\* (?P<date>.+)\n"
+    r"⏰ \*\*Time:\*\* (?P<time>\S+)"
+)
+
+def calendar_created_reply(result: str):
+    """Spoken confirmation built from what the calendar tool actually created."""
+    match = CALENDAR_CREATED_PATTERN.match(result)
+    if match is None:
+        return None
+    return f"I've scheduled {match['title']} for {match['date']} at {match['time']}."
+
+# Replies for tools whose successful result needs no rewording; a template
+# returns None (failures, other actions) to fall back to the LLM in Stage 3
+RESPONSE_TEMPLATES = {
+    "get_current_weather": lambda params, result: (
+        result if result.startswith("The current weather") else None
+    ),
+    "launch_application": lambda params, result: (
+        f"Opened {params.get('app_name', 'the application')}." if result.startswith("✅") else None
+    ),
+    "calendar_management": lambda params, result: calendar_created_reply(result),
+    "email_management": lambda params, result: (
+        f"Your email to {params.get('to', 'them')} has been sent."
+        if params.get("action") == "send" and result.startswith("✅") else None
+    ),
+}
+
+def stream_sentences(prompt: str, on_sentence) -> str:
+    """Stream an LLM reply, passing each completed sentence to on_sentence.
+    
+    Generation runs on a background thread, so the model keeps producing the
+    next sentence while on_sentence (text-to-speech) runs on the caller's thread.
+    """
+    sentences = queue.Queue()
+    chunks = []
+    errors = []
+    
+    def generate():
+        text = ""
+        spoken_upto = 0
+        try:
+            for chunk in get_llm().stream(prompt):
+                chunks.append(chunk.content)
+                text += chunk.content
+                boundaries = list(SENTENCE_BOUNDARY.finditer(text, spoken_upto))
+                if boundaries:
+                    end = boundaries[-1].end()
+                    sentence = text[spoken_upto:end].strip()
+                    if sentence:
+                        sentences.put(sentence)
+                    spoken_upto = end
+            
+            remainder = text[spoken_upto:].strip()
+            if remainder:
+                sentences.put(remainder)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            sentences.put(None)
+    
+    threading.Thread(target=generate, daemon=True).start()
+    for sentence in iter(sentences.get, None):
+        on_sentence(sentence)
+    
+    if errors:
+        raise errors[0]
+    return "".join(chunks).strip()
 
 # Custom Tool Execution System
-def execute_tool_command(command: str) -> str:
-    """Two-stage tool execution system"""
-    import json
-    import traceback
+def execute_tool_command(command: str, on_sentence=None) -> str:
+    """Two-stage tool execution system.
     
+    If on_sentence is given, the final response is streamed and each
+    sentence is passed to it as soon as it is generated.
+    """
     try:
-        # Stage 1: Get tool selection as JSON
-        logging.info("🎯 Stage 1: Getting tool selection...")
-        tool_prompt = f"{TOOL_SELECTION_PROMPT}\n\nUser: \"{command}\""
-        
-        response = llm.invoke(tool_prompt)
-        json_response = response.content.strip()
-        
-        logging.info(f"📋 Raw model response: {json_response}")
+        # Stage 1: Get tool selection as JSON (routed and repeat commands skip the LLM)
+        cache_key = normalize_command(command)
+        tool_call = route_command(command)
+        cached = tool_call is not None
         
-        # Clean up response - sometimes models add extra text
-        if json_response.startswith("```json"):
-            json_response = json_response.replace("```json", "").replace("```", "").strip()
+        if cached:
+            logging.info("⚡ Stage 1: Matched fast-path route")
+        else:
+            tool_call = get_cached_tool_call(cache_key)
+            cached = tool_call is not None
+            if cached:
+                logging.info("⚡ Stage 1: Using cached tool selection")
         
-        # Find JSON object in response
-        start_idx = json_response.find('{')
-        end_idx = json_response.rfind('}') + 1
-        if start_idx != -1 and end_idx > start_idx:
-            json_response = json_response[start_idx:end_idx]
+        if not cached:
+            logging.info("🎯 Stage 1: Getting tool selection...")
+            response = get_tool_selection_chain().invoke({"command": command})
+            logging.debug("📋 Raw model response: %s", response.content)
+            
+            try:
+                tool_call = json.loads(response.content)
+            except json.JSONDecodeError as e:
+                logging.error(f"❌ JSON parsing failed: {e}")
+                logging.error(f"Raw response: {response.content}")
+                return "Sorry, I had trouble understanding that command. Could you rephrase it?"
         
-        # Parse JSON response
         try:
-            tool_call = json.loads(json_response)
             tool_name = tool_call["tool"]
             parameters = tool_call["parameters"]
             
             logging.info(f"🔧 Tool: {tool_name}")
             logging.info(f"📝 Parameters: {parameters}")
             
-        except json.JSONDecodeError as e:
-            logging.error(f"❌ JSON parsing failed: {e}")
-            logging.error(f"Raw response: {json_response}")
-            return "Sorry, I had trouble understanding that command. Could you rephrase it?"
-        except KeyError as e:
+        except (KeyError, TypeError) as e:
             logging.error(f"❌ Missing key in JSON: {e}")
             return "Sorry, I couldn't determine what action to take. Could you be more specific?"
         
         # Stage 2: Execute the tool
-        if tool_name not in TOOL_REGISTRY:
+        tool_func = get_tool_registry().get(tool_name)
+        if tool_func is None:
             logging.error(f"❌ Unknown tool: {tool_name}")
-            return f"Sorry, I don't have access to the '{tool_name}' function."
+            return UNKNOWN_TOOL_MESSAGE.format(tool_name)
         
         logging.info("🚀 Stage 2: Executing tool...")
-        tool_func = TOOL_REGISTRY[tool_name]
         
         try:
             # Execute the tool with parameters
             tool_result = tool_func(**parameters)
-            logging.info(f"✅ Tool executed successfully")
-            logging.info(f"📊 Tool result: {tool_result[:200]}...")
+            logging.info("✅ Tool executed successfully")
+            logging.debug("📊 Tool result: %.200s...", tool_result)
+            if not cached and is_cacheable_tool_call(command, tool_call, tool_result):
+                cache_tool_call(cache_key, tool_call)
             
         except TypeError as e:
             logging.error(f"❌ Tool execution failed - parameter error: {e}")
@@ -165,7 +425,15 @@ def execute_tool_command(command: str) -> str:
             logging.error(f"❌ Tool execution failed: {e}")
             return f"Sorry, I encountered an error: {str(e)}"
         
-        # Stage 3: Generate natural response
+        # Stage 3: Generate natural response (templated when the result is predictable)
+        template = RESPONSE_TEMPLATES.get(tool_name)
+        result = template(parameters, tool_result) if template else None
+        if result:
+            logging.info("⚡ Stage 3: Using templated response")
+            if on_sentence:
+                on_sentence(result)
+            return result
+        
         logging.info("💬 Stage 3: Generating conversational response...")
         response_prompt = RESPONSE_GENERATION_PROMPT.format(
             command=command,
@@ -173,10 +441,13 @@ def execute_tool_command(command: str) -> str:
             tool_result=tool_result
         )
         
-        final_response = llm.invoke(response_prompt)
-        result = final_response.content.strip()
+        if on_sentence:
+            result = stream_sentences(response_prompt, on_sentence)
+        else:
+            final_response = get_llm().invoke(response_prompt)
+            result = final_response.content.strip()
         
-        logging.info(f"🎤 Final response: {result[:100]}...")
+        logging.debug("🎤 Final response: %.100s...", result)
         return result
         
     except Exception as e:
@@ -188,31 +459,53 @@ def execute_tool_command(command: str) -> str:
 def write():
     conversation_mode = False
     last_interaction_time = None
-    session_id = str(uuid.uuid4())
+    session_id = uuid.uuid4().hex
 
     # Initialize database
     try:
-        from db.models import create_engine_and_tables
+        from db.models import create_engine_and_tables, checkpoint_database
         create_engine_and_tables()
         logging.info("✅ Database initialized successfully")
     except Exception as e:
         logging.warning(f"⚠️ Database initialization failed: {e}")
 
+    warm_llm()
+    wake_word = load_wake_word_detector(MIC_INDEX)
+
     try:
         while True:
             try:
                 if not conversation_mode:
-                    logging.info("🎤 Listening for wake word...")
-                    audio = stt.listen()
-                    transcript = stt.transcribe(audio)
-
-                    if transcript and TRIGGER_WORD in transcript.lower():
-                        logging.info(f"🗣 Triggered by: {transcript}")
-                        tts.speak("Yes sir?")
-                        conversation_mode = True
-                        last_interaction_time = time.time()
+                    if wake_word is not None:
+                        # An on-device model scores raw mic frames, nothing is transcribed while idle
+                        logging.info("🎤 Listening for wake word...")
+                        trigger = wake_word.wait()
                     else:
-                        logging.debug("Wake word not detected.")
+                        # Capture continues in the background while each clip is transcribed
+                        if stt.clips.empty():
+                            logging.info("🎤 Listening for wake word...")
+                        stt.start_background()
+                        audio = stt.clips.get()
+                        trigger = stt.transcribe(audio)
+                        if not (trigger and WAKE_WORD_PATTERN.search(trigger)):
+                            logging.debug("Wake word not detected.")
+                            continue
+                        stt.stop_background()
+
+                    logging.info(f"🗣 Triggered by: {trigger}")
+                    warm_llm()
+                    warm_tools()
+                    tts.speak("Yes sir?")
+                    conversation_mode = True
+                    last_interaction_time = time.time()
+                elif time.time() - last_interaction_time > CONVERSATION_TIMEOUT:
+                    logging.info("⌛ Timeout: Returning to wake word mode.")
+                    conversation_mode = False
+                    # Idle now, so fold the WAL back into the database file
+                    try:
+                        checkpoint_database()
+                    except Exception as e:
+                        logging.warning(f"⚠️ Database checkpoint failed: {e}")
                 else:
                     logging.info("🎤 Listening for next command...")
                     audio = stt.listen()
@@ -223,16 +516,23 @@ def write():
 
                     logging.info(f"📥 Command: {command}")
                     
-                    if "shut down" in command.lower():
+                    if SHUTDOWN_PATTERN.search(command):
                         tts.speak("Shutting down, sir.")
                         break
 
                     # Use new two-stage tool execution system
                     logging.info("🤖 Processing command with new system...")
-                    content = execute_tool_command(command)
+                    spoken = []
+                    
+                    def speak_sentence(sentence):
+                        spoken.append(sentence)
+                        tts.speak(sentence)
+                    
+                    content = execute_tool_command(command, on_sentence=speak_sentence)
                     
                     # Store in memory
                     try:
+                        from db.memory import memory_system
                         memory_system.store_conversation(
                             session_id=session_id,
                             user_message=command,
@@ -245,13 +545,11 @@ def write():
                     logging.info(f"✅ System responded: {content}")
 
                     print("Jarvis:", content)
-                    tts.speak(content)
+                    if not spoken:
+                        # Error replies are returned whole rather than streamed
+                        tts.speak(content)
                     last_interaction_time = time.time()
 
-                    if time.time() - last_interaction_time > CONVERSATION_TIMEOUT:
-                        logging.info("⌛ Timeout: Returning to wake word mode.")
-                        conversation_mode = False
-
             except Exception as e:
                 logging.error(f"❌ Error in interaction loop: {e}")
                 time.sleep(1)
@@ -260,6 +558,8 @@ def write():
         logging.info("🛑 Manual interrupt received. Exiting.")
     except Exception as e:
         logging.critical(f"❌ Critical error in main loop: {e}")
+    finally:
+        stt.stop_background()
 
 
 if __name__ == "__main__":
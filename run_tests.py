@@ -18,24 +18,32 @@ from datetime import datetime
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Ollama's model list endpoint (OLLAMA_HOST may omit the scheme)
+OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'localhost:11434')
+OLLAMA_TAGS_URL = f"{OLLAMA_HOST if '://' in OLLAMA_HOST else 'http://' + OLLAMA_HOST}/api/tags"
+
 def check_prerequisites():
     """Check if system is ready for testing"""
     print("🔍 Checking prerequisites...")
     
     # Check if Ollama is running
     try:
-        import subprocess
-        result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, timeout=5)
-        if result.returncode != 0:
-            print("❌ Ollama is not running. Start with: ollama serve")
-            return False
-        if 'llama3.2' not in result.stdout.lower():
-            print("❌ llama3.2 model not found. Install with: ollama pull llama3.2")
-            return False
-        print("✅ Ollama and llama3.2 model ready")
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        print("❌ Ollama not found. Install from: https://ollama.ai")
+        import requests
+        response = requests.get(OLLAMA_TAGS_URL, timeout=2)
+    except ImportError:
+        print("❌ requests is not installed")
+        return False
+    except requests.RequestException:
+        print("❌ Ollama is not running. Start with: ollama serve (install from https://ollama.ai)")
+        return False
+    if not response.ok:
+        print("❌ Ollama is not responding. Start with: ollama serve")
+        return False
+    models = [model["name"].lower() for model in response.json().get("models", [])]
+    if not any('llama3.2' in name for name in models):
+        print("❌ llama3.2 model not found. Install with: ollama pull llama3.2")
         return False
+    print("✅ Ollama and llama3.2 model ready")
     
     # Check environment file
     if not os.path.exists('.env'):
@@ -63,13 +71,15 @@ def run_smoke_tests():
     
     # Run only basic tests for each category
     print("Testing basic functionality...")
-    suite.test_weather_basic()
-    suite.test_terminal_basic()
-    suite.test_email_basic()
-    suite.test_calendar_basic()
-    suite.test_web_search_basic()
-    suite.test_app_launcher_basic()
-    suite.test_memory_basic()
+    suite.run_concurrently([
+        suite.test_weather_basic,
+        suite.test_terminal_basic,
+        suite.test_email_basic,
+        suite.test_calendar_basic,
+        suite.test_web_search_basic,
+        suite.test_app_launcher_basic,
+        suite.test_memory_basic,
+    ])
     
     suite.generate_report()
     return suite.results
@@ -83,8 +93,7 @@ def run_security_tests():
     suite = JarvisTestSuite()
     
     # Run security-specific tests
-    suite.test_terminal_security()
-    suite.test_security_penetration()
+    suite.run_concurrently([suite.test_terminal_security, suite.test_security_penetration])
     
     suite.generate_report()
     return suite.results
@@ -113,10 +122,11 @@ def run_category_tests(category):
     }
     
     if category in category_methods:
-        for method_name in category_methods[category]:
-            if hasattr(suite, method_name):
-                method = getattr(suite, method_name)
-                method()
+        suite.run_concurrently([
+            getattr(suite, method_name)
+            for method_name in category_methods[category]
+            if hasattr(suite, method_name)
+        ])
         suite.generate_report()
     else:
         print(f"❌ Unknown category: {category}")
@@ -169,9 +179,15 @@ def main():
         
         # Summary
         if results:
-            successful = sum(1 for r in results if r.success)
-            total = len(results)
-            print(f"\n🏁 Test Summary: {successful}/{total} passed ({successful/total*100:.1f}%)")
+            # Semantic-cache hits (success=None) aren't scored
+            scored = [r for r in results if r.success is not None]
+            cached = len(results) - len(scored)
+            successful = sum(1 for r in scored if r.success)
+            total = len(scored)
+            rate = successful / total * 100 if total else 0
+            print(f"\n🏁 Test Summary: {successful}/{total} passed ({rate:.1f}%)")
+            if cached:
+                print(f"♻️ {cached} tests reused a cached answer and were not scored")
             
             if successful < total:
                 print("⚠️ Some tests failed. Check the detailed logs in test_logs/ directory.")
@@ -6,10 +6,42 @@ Run this script to start Jarvis with proper setup validation.
 
 import os
 import sys
-import subprocess
+import json
+import time
 import importlib.util
 from pathlib import Path
 
+# Ollama's model list endpoint (OLLAMA_HOST may omit the scheme)
+OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'localhost:11434')
+OLLAMA_TAGS_URL = f"{OLLAMA_HOST if '://' in OLLAMA_HOST else 'http://' + OLLAMA_HOST}/api/tags"
+
+# A full pass of the checks is remembered for an hour, unless the setup changes
+STARTUP_CACHE = Path(__file__).with_name('.startup_cache.json')
+STARTUP_CACHE_TTL = 3600  # seconds
+
+def _setup_fingerprint():
+    """What the checks depend on: interpreter, requirements and .env."""
+    fingerprint = {'python': sys.executable}
+    for name in ('.env', 'requirements.txt'):
+        path = Path(name)
+        fingerprint[name] = path.stat().st_mtime if path.exists() else None
+    return fingerprint
+
+def checks_recently_passed():
+    """True if every check passed within STARTUP_CACHE_TTL with the same setup."""
+    try:
+        cached = json.loads(STARTUP_CACHE.read_text())
+    except (OSError, ValueError):
+        return False
+    return (time.time() - cached.get('ts', 0) < STARTUP_CACHE_TTL
+            and cached.get('fingerprint') == _setup_fingerprint())
+
+def remember_checks_passed():
+    try:
+        STARTUP_CACHE.write_text(json.dumps({'ts': time.time(), 'fingerprint': _setup_fingerprint()}))
+    except OSError:
+        pass
+
 def check_python_version():
     """Check if Python version is 3.8+"""
     if sys.version_info < (3, 8):
@@ -21,20 +53,21 @@ def check_python_version():
 def check_ollama():
     """Check if Ollama is running and has required models"""
     try:
-        result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            models = result.stdout.lower()
-            if 'llama3.2' in models or 'llama3' in models:
-                print("✅ Ollama is running with required models")
-                return True
-            else:
-                print("⚠️ Ollama is running but llama3.2 model not found")
-                print("Run: ollama pull llama3.2")
-                return False
+        import requests
+        response = requests.get(OLLAMA_TAGS_URL, timeout=2)
+        response.raise_for_status()
+        models = [model["name"].lower() for model in response.json().get("models", [])]
+        if any('llama3.2' in name or 'llama3' in name for name in models):
+            print("✅ Ollama is running with required models")
+            return True
         else:
-            print("❌ Ollama is not responding")
+            print("⚠️ Ollama is running but llama3.2 model not found")
+            print("Run: ollama pull llama3.2")
             return False
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except ImportError:
+        print("❌ requests is not installed")
+        return False
+    except Exception:
         print("❌ Ollama not found or not running")
         print("Install from: https://ollama.ai")
         print("Then run: ollama pull llama3.2")
@@ -130,14 +163,9 @@ def initialize_database():
         print(f"❌ Database initialization failed: {e}")
         return False
 
-def main():
-    """Main startup routine"""
-    print("🚀 Starting Jarvis AI Assistant...")
-    print("=" * 50)
-    
-    # Run all checks
+def run_checks():
+    """Run every system check; returns how many passed."""
     checks_passed = 0
-    total_checks = 6
     
     print("🔍 System Check 1/6: Python Version")
     check_python_version()
@@ -163,6 +191,25 @@ def main():
     if initialize_database():
         checks_passed += 1
     
+    return checks_passed
+
+def main():
+    """Main startup routine"""
+    print("🚀 Starting Jarvis AI Assistant...")
+    print("=" * 50)
+    
+    # Run all checks
+    checks_passed = 0
+    total_checks = 6
+    
+    if checks_recently_passed():
+        print(f"✅ All system checks passed within the last hour, skipping (delete {STARTUP_CACHE.name} to re-run)")
+        checks_passed = total_checks
+    else:
+        checks_passed = run_checks()
+        if checks_passed == total_checks:
+            remember_checks_passed()
+    
     print("\n" + "=" * 50)
     print(f"✅ System checks completed: {checks_passed}/{total_checks} passed")
     
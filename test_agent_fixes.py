@@ -30,7 +30,7 @@ def test_agent_fixes():
     print("=" * 50)
     
     # Setup agent exactly like main.py (after fixes)
-    llm = ChatOllama(model="llama3.2")
+    llm = ChatOllama(model="llama3.2", keep_alive="30m")
     
     tools = [
         get_current_weather_tool,
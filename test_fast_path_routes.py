@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the fast-path command router in main.py.
+
+Routed commands skip the tool-selection LLM, so anything the router
+accepts must map to exactly one complete tool call; compound or
+time-qualified requests have to fall through (route_command -> None).
+
+Run with: python -m unittest test_fast_path_routes
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import route_command
+
+# (command, expected tool call)
+ROUTED_CASES = [
+    ("Open Chrome", {"tool": "launch_application", "parameters": {"app_name": "Chrome"}}),
+    ("open spotify", {"tool": "launch_application", "parameters": {"app_name": "spotify"}}),
+    ("Please launch Visual Studio Code.", {"tool": "launch_application", "parameters": {"app_name": "Visual Studio Code"}}),
+    ("open calculator app", {"tool": "launch_application", "parameters": {"app_name": "calculator"}}),
+    ("What's the weather in London?", {"tool": "get_current_weather", "parameters": {"city": "London"}}),
+    ("weather in New York right now", {"tool": "get_current_weather", "parameters": {"city": "New York"}}),
+    ("what is the weather like for San Francisco today", {"tool": "get_current_weather", "parameters": {"city": "San Francisco"}}),
+    ("What's the weather?", {"tool": "get_current_weather", "parameters": {"city": "New York"}}),
+    ("Check my emails", {"tool": "email_management", "parameters": {"action": "check", "limit": 5, "unread_only": True}}),
+    ("list files", {"tool": "run_terminal_command", "parameters": {"command": "ls -la"}}),
+]
+
+# Compound, forecast and non-app requests that must go to the LLM
+UNROUTED_CASES = [
+    "open spotify and play some jazz",
+    "Open Chrome and search for cats",
+    "open terminal and run ls",
+    "open the pod bay doors",
+    "open my email",
+    "What's the weather in London tomorrow?",
+    "weather in Paris this weekend",
+    "weather in Berlin on Monday",
+    "weather for Tokyo next week",
+    "weather in Rome tonight",
+    "check my emails from Bob",
+    "list files on the desktop",
+]
+
+class FastPathRouteTest(unittest.TestCase):
+    def test_routed_commands(self):
+        for command, expected in ROUTED_CASES:
+            with self.subTest(command=command):
+                self.assertEqual(route_command(command), expected)
+
+    def test_unrouted_commands_fall_through(self):
+        for command in UNROUTED_CASES:
+            with self.subTest(command=command):
+                self.assertIsNone(route_command(command))
+
+if __name__ == "__main__":
+    unittest.main()
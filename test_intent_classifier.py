@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Routing regression test for the intent classifier.
+
+The expected intents and confidences below were produced by the original
+(pattern-by-pattern re.search) classifier. The keyword index, fused
+patterns and optional RE2 path must keep reproducing them exactly.
+
+Run with: python -m unittest test_intent_classifier
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.intent_classifier import IntentClassifier, Intent
+
+# (input, expected intent, expected confidence)
+CURATED_CASES = [
+    ('Schedule a meeting with John tomorrow at 3pm', 'CALENDAR_CREATE', 0.6667),
+    ('Create an event called launch party', 'CALENDAR_CREATE', 0.1667),
+    ('Add a dentist appointment on Friday', 'CALENDAR_CREATE', 0.1667),
+    ('Remind me to call mom', 'CALENDAR_CREATE', 0.1667),
+    ('Remind me about the report', 'CALENDAR_CREATE', 0.1667),
+    ('Gym at 6', 'CALENDAR_CREATE', 0.1667),
+    ('Dinner at 7:30 with Sarah', 'CALENDAR_CREATE', 0.1667),
+    ("I'm going to the gym", 'CALENDAR_CREATE', 0.1667),
+    ('Set up a reminder for the standup', 'CALENDAR_CREATE', 0.1667),
+    ('Calendar for next week at 9', 'CALENDAR_CREATE', 0.3333),
+    ('Tomorrow at 10 team sync', 'CALENDAR_CREATE', 0.1667),
+    ("What's on my calendar?", 'CALENDAR_CHECK', 0.5),
+    ('Check my schedule for today', 'CALENDAR_CHECK', 0.25),
+    ('Show my upcoming meetings', 'CALENDAR_CHECK', 0.5),
+    ('What do I have on my calendar tomorrow', 'CALENDAR_CHECK', 0.25),
+    ('Am I free tomorrow?', 'CALENDAR_CHECK', 0.25),
+    ('Are you busy next week', 'CALENDAR_CHECK', 0.25),
+    ('Next events please', 'CALENDAR_CHECK', 0.25),
+    ('Find the meeting with Alice', 'CALENDAR_SEARCH', 0.5),
+    ('Search for the budget meeting', 'CALENDAR_SEARCH', 0.5),
+    ('When is my dentist appointment?', 'CALENDAR_SEARCH', 0.5),
+    ('When was the last board meeting', 'CALENDAR_SEARCH', 0.5),
+    ('Send an email to Bob about the launch', 'EMAIL_SEND', 0.6667),
+    ('Write a message to the team', 'EMAIL_SEND', 0.3333),
+    ('Compose mail to HR', 'EMAIL_SEND', 0.6667),
+    ('Email Sarah about dinner', 'EMAIL_SEND', 0.3333),
+    ("Tell him via email that I'm late", 'EMAIL_SEND', 0.3333),
+    ('Mail to support@example.com', 'EMAIL_SEND', 0.3333),
+    ('Check my emails', 'EMAIL_READ', 0.5),
+    ('Read my inbox', 'EMAIL_READ', 0.5),
+    ('Show unread mail', 'EMAIL_READ', 0.5),
+    ('Any new emails?', 'GENERAL', 0.0),
+    ('Latest messages from work', 'EMAIL_READ', 0.5),
+    ("What's the weather?", 'WEATHER', 0.6667),
+    ("What's the weather in London?", 'WEATHER', 0.6667),
+    ("How's the temperature outside", 'WEATHER', 0.6667),
+    ('Forecast for Paris', 'WEATHER', 0.3333),
+    ('Is it sunny today?', 'WEATHER', 0.3333),
+    ('Will it rain tomorrow', 'WEATHER', 0.3333),
+    ('Is it cold outside', 'WEATHER', 0.3333),
+    ('whats the weather like', 'WEATHER', 0.6667),
+    ('Open Chrome', 'APP_LAUNCH', 0.3333),
+    ('Open Spotify', 'APP_LAUNCH', 0.3333),
+    ('Launch the calculator app', 'APP_LAUNCH', 0.3333),
+    ('Start the music application', 'APP_LAUNCH', 0.3333),
+    ('Open Xcode.app', 'APP_LAUNCH', 0.6667),
+    ('Run the program', 'APP_LAUNCH', 0.3333),
+    ('open slack', 'APP_LAUNCH', 0.3333),
+    ('Launch Safari', 'GENERAL', 0.0),
+    ('List files', 'GENERAL', 0.0),
+    ('ls on desktop', 'TERMINAL', 0.25),
+    ('Run ellis', 'TERMINAL', 0.375),
+    ('git status', 'TERMINAL', 0.125),
+    ('git commit and push', 'TERMINAL', 0.125),
+    ('Execute the build script', 'TERMINAL', 0.125),
+    ('pip install requests', 'TERMINAL', 0.125),
+    ('docker ps', 'TERMINAL', 0.125),
+    ('mkdir projects', 'TERMINAL', 0.125),
+    ('Open terminal and run a command', 'TERMINAL', 0.25),
+    ('bash script please', 'TERMINAL', 0.125),
+    ('Search for Python tutorials', 'WEB_SEARCH', 0.3333),
+    ('Google the best pizza near me', 'GENERAL', 0.0),
+    ('Look up LangChain docs', 'GENERAL', 0.0),
+    ('What is quantum computing?', 'WEB_SEARCH', 0.3333),
+    ('Who is the president of France', 'WEB_SEARCH', 0.3333),
+    ('How to install Docker', 'WEB_SEARCH', 0.3333),
+    ('Browse the web for cheap flights', 'WEB_SEARCH', 0.3333),
+    ('Find information about Mars', 'WEB_SEARCH', 0.3333),
+    ('What did I say about the project?', 'MEMORY_LOOKUP', 0.3333),
+    ('Remember what I told you yesterday', 'GENERAL', 0.0),
+    ('Recall the previous conversation', 'MEMORY_LOOKUP', 0.3333),
+    ('What did we discuss earlier in our discussion', 'MEMORY_LOOKUP', 0.3333),
+    ('Show my history', 'MEMORY_LOOKUP', 0.3333),
+    ('Any context from the past?', 'MEMORY_LOOKUP', 0.3333),
+    ('Hello', 'GENERAL', 0.0),
+    ('Thanks Jarvis', 'GENERAL', 0.0),
+    ('', 'GENERAL', 0.0),
+    ('   ', 'GENERAL', 0.0),
+    ('?!', 'GENERAL', 0.0),
+    ('Tell me a joke', 'GENERAL', 0.0),
+    ("I'm running late", 'GENERAL', 0.0),
+    ('The server is on fire', 'GENERAL', 0.0),
+    ("What's 2+2?", 'GENERAL', 0.0),
+    ('Can you open it?', 'GENERAL', 0.0),
+    ("Don't send that email", 'EMAIL_SEND', 0.3333),
+    ('Chck my emials pls', 'GENERAL', 0.0),
+    ('Check my cal & email ASAP', 'EMAIL_READ', 0.5),
+    ("What's the weather? Is it sunny? Should I wear shorts?", 'WEATHER', 0.6667),
+    ("I'm so frustrated! Can you help me find my calendar?", 'GENERAL', 0.0),
+    ("If it's raining tomorrow, reschedule my outdoor meeting", 'GENERAL', 0.0),
+    ('Search for information about our project and email the summary to John', 'EMAIL_SEND', 0.3333),
+    ('List my desktop files and email the list to myself', 'EMAIL_SEND', 0.3333),
+    ('Remember what I searched for last week and search for updates', 'WEB_SEARCH', 0.3333),
+    ('Schedule gym at 5pm today', 'CALENDAR_CREATE', 0.3333),
+    ('Book lunch with mom next Thursday around noon-ish', 'GENERAL', 0.0),
+    ('Block calendar for vacation next week', 'CALENDAR_CREATE', 0.1667),
+    ("WHAT'S THE WEATHER IN NEW YORK", 'WEATHER', 0.6667),
+    ('oPeN cHrOmE', 'APP_LAUNCH', 0.3333),
+    ('Weather in São Paulo', 'WEATHER', 0.3333),
+    ('天気 in Tokyo', 'GENERAL', 0.0),
+    ('Search for C++ programming', 'WEB_SEARCH', 0.3333),
+    ("'; DROP TABLE users; --", 'GENERAL', 0.0),
+    ("<script>alert('xss')</script>", 'GENERAL', 0.0),
+    ('%s %d %x %n', 'GENERAL', 0.0),
+    ('rm -rf /', 'TERMINAL', 0.125),
+    ('cat /etc/passwd | grep root', 'GENERAL', 0.0),
+]
+
+# Seeded random phrases over the patterns' vocabulary (random.Random(20261015))
+FUZZ_CASES = [
+    ('find run start ,', 'TERMINAL', 0.25),
+    ('?', 'GENERAL', 0.0),
+    ('Remember previous when please have tell app have web', 'MEMORY_LOOKUP', 0.3333),
+    ('At next history it please', 'MEMORY_LOOKUP', 0.3333),
+    ('add', 'GENERAL', 0.0),
+    ('upcoming', 'GENERAL', 0.0),
+    ('. say tell', 'GENERAL', 0.0),
+    ('Event up', 'GENERAL', 0.0),
+    ('Week for slack 10:30 shell what emails workout', 'TERMINAL', 0.125),
+    ('past context context cd', 'MEMORY_LOOKUP', 0.3333),
+    ('pip', 'TERMINAL', 0.125),
+    ('Hot rain search shell , look', 'TERMINAL', 0.125),
+    ('context how slack safari that', 'MEMORY_LOOKUP', 0.3333),
+    ('how who emails recall .', 'GENERAL', 0.0),
+    ('command previous slack week cloudy execute cloudy', 'TERMINAL', 0.125),
+    ('new and @ busy who by', 'GENERAL', 0.0),
+    ('email', 'GENERAL', 0.0),
+    ('Ls outside messages', 'TERMINAL', 0.125),
+    ('create look', 'GENERAL', 0.0),
+    ("what's in", 'GENERAL', 0.0),
+    ('message whats show and how or month', 'GENERAL', 0.0),
+    ("how's bash cp cp discord", 'TERMINAL', 0.25),
+    ('any docker create tomorrow a create tomorrow', 'TERMINAL', 0.125),
+    ('Of chrome app whats ellis', 'TERMINAL', 0.125),
+    ('Open dinner past recall 10:30 please messages cold', 'MEMORY_LOOKUP', 0.3333),
+    ('@ at program app in git the check paris', 'GENERAL', 0.0),
+    ('a appointment', 'GENERAL', 0.0),
+    ('Find chrome with was command in look compose', 'TERMINAL', 0.125),
+    ("teams what's going docker who before , tomorrow how's", 'TERMINAL', 0.125),
+    (', application rain @ me', 'GENERAL', 0.0),
+    ('dinner inbox appointment status forecast execute who show spotify', 'WEATHER', 0.3333),
+    ('whats inbox', 'GENERAL', 0.0),
+    ("by launch when remind who what's mention", 'GENERAL', 0.0),
+    ('new workout chrome', 'GENERAL', 0.0),
+    ('remind history commit', 'MEMORY_LOOKUP', 0.3333),
+    ('gym this calendar messages history emails', 'MEMORY_LOOKUP', 0.3333),
+    ('conversation npm meeting and with', 'TERMINAL', 0.125),
+    ('add do pull', 'GENERAL', 0.0),
+    ('of', 'GENERAL', 0.0),
+    ('please for past discussion write before run', 'MEMORY_LOOKUP', 0.3333),
+    ('Cloudy hot program web with forecast lunch cloudy', 'WEATHER', 0.3333),
+    ('browse weather application find push plan execute show', 'WEATHER', 0.3333),
+    ('xcode.app for today available about 10:30 earlier emails calendar', 'GENERAL', 0.0),
+    ('xcode.app', 'GENERAL', 0.0),
+    ('10:30 conversation was temperature slack how safari the earlier', 'WEATHER', 0.3333),
+    ('dinner show sunny launch push execute', 'TERMINAL', 0.125),
+    ('Open remember did rm via', 'TERMINAL', 0.125),
+    ('safari discussion upcoming meeting command', 'TERMINAL', 0.125),
+    ('Schedule . set dinner weather mention docker', 'WEATHER', 0.3333),
+    ('In dinner workout schedule pip i up', 'TERMINAL', 0.125),
+    ('pip !', 'TERMINAL', 0.125),
+    ('firefox was', 'GENERAL', 0.0),
+    ('push check program terminal was today', 'TERMINAL', 0.125),
+    ('Read mention spotify', 'GENERAL', 0.0),
+    ('Recall calendar today free upcoming mail or say and', 'MEMORY_LOOKUP', 0.3333),
+    ('Commit dinner dinner', 'GENERAL', 0.0),
+    ('Find tell 10:30 cmd start open was in 5pm', 'TERMINAL', 0.125),
+    ("Terminal how's to did forecast busy", 'WEATHER', 0.3333),
+    ('or appointment did', 'GENERAL', 0.0),
+    ('At reminder', 'GENERAL', 0.0),
+    ('mail , it safari inbox me mention any 5pm', 'GENERAL', 0.0),
+    ('outside ? today remember check', 'GENERAL', 0.0),
+    ('with shell meeting upcoming appointment month', 'TERMINAL', 0.125),
+    ('@ cloudy london commit app it via', 'GENERAL', 0.0),
+    ('a mail ls free', 'TERMINAL', 0.125),
+    ('Weather email who program', 'WEATHER', 0.3333),
+    ('spotify', 'GENERAL', 0.0),
+    ('teams', 'GENERAL', 0.0),
+    ('rm', 'TERMINAL', 0.125),
+    ('today today appointment have previous', 'GENERAL', 0.0),
+    ("with remember do plan what's dinner", 'GENERAL', 0.0),
+    ('my launch', 'GENERAL', 0.0),
+    ('my teams . this', 'GENERAL', 0.0),
+    ('reminder tomorrow', 'GENERAL', 0.0),
+    ('Any context', 'MEMORY_LOOKUP', 0.3333),
+    ('mention chrome today gym 10:30 emails set how status', 'GENERAL', 0.0),
+    ('pull emails bash about message send set ? gym', 'TERMINAL', 0.125),
+    ("How's say ellis cp search is", 'TERMINAL', 0.25),
+    ('Status tomorrow available ! discussion paris available', 'GENERAL', 0.0),
+    ('Upcoming me reminder compose email 5pm recall', 'EMAIL_SEND', 0.3333),
+    ('Meeting how at and write sunny rm', 'TERMINAL', 0.125),
+    ('Execute in who write open run', 'TERMINAL', 0.125),
+    ('commit please show discord appointment', 'GENERAL', 0.0),
+    ('latest remember who reminder ? send shell is program', 'TERMINAL', 0.125),
+    ("terminal check of what's email on event next", 'EMAIL_READ', 0.5),
+    ('latest my hot conversation cd jarvis before schedule workout', 'TERMINAL', 0.125),
+    ('discussion web', 'GENERAL', 0.0),
+    ('Cd remind on on busy hot teams ?', 'TERMINAL', 0.125),
+    ('cmd my history npm compose', 'MEMORY_LOOKUP', 0.3333),
+    ('a', 'GENERAL', 0.0),
+    ('busy what', 'GENERAL', 0.0),
+    ("Write cmd docker busy how's @", 'TERMINAL', 0.25),
+    ('Inbox app message sunny docker launch what read', 'TERMINAL', 0.125),
+    ('find find a of', 'GENERAL', 0.0),
+    ('mention was', 'GENERAL', 0.0),
+    ('cloudy about google past me mv lunch', 'MEMORY_LOOKUP', 0.3333),
+    ('The next up about john when', 'GENERAL', 0.0),
+    ('that internet available jarvis', 'GENERAL', 0.0),
+    ('tomorrow cloudy', 'GENERAL', 0.0),
+    ('add run appointment google recall past inbox rm outside', 'TERMINAL', 0.375),
+    ('set messages npm appointment emails', 'TERMINAL', 0.125),
+    ('Inbox email schedule', 'GENERAL', 0.0),
+    ('write remember available launch context', 'MEMORY_LOOKUP', 0.3333),
+    ("! what's pull remind chrome context how lunch 10:30", 'MEMORY_LOOKUP', 0.3333),
+    ('email have jarvis show lunch john how ls did', 'TERMINAL', 0.125),
+    ("what's gym my . execute calendar", 'CALENDAR_CHECK', 0.25),
+    ('ellis', 'TERMINAL', 0.125),
+    ("how's please earlier npm messages compose", 'TERMINAL', 0.125),
+    ('mail , available have appointment status', 'GENERAL', 0.0),
+    ('my teams by , outside set', 'GENERAL', 0.0),
+    ('5pm jarvis set forecast send did xcode.app 5pm do', 'WEATHER', 0.3333),
+    ('tell', 'GENERAL', 0.0),
+    ("Please remind find weather what's open tomorrow to 3", 'WEATHER', 0.3333),
+    ('start cp browse emails say', 'TERMINAL', 0.125),
+    ('was app ? ls set', 'TERMINAL', 0.125),
+    ('cd appointment', 'TERMINAL', 0.125),
+    ('Today dinner via program internet how with', 'GENERAL', 0.0),
+    ("What's appointment with pull going start this safari", 'GENERAL', 0.0),
+    ('send 10:30 do how whats', 'GENERAL', 0.0),
+    ('message compose jarvis the push application temperature cmd weather', 'WEATHER', 0.3333),
+    ('Available send safari temperature gym cp', 'WEATHER', 0.3333),
+    ('when', 'GENERAL', 0.0),
+    ('Hot 10:30 emails conversation lunch', 'GENERAL', 0.0),
+    ('cmd cmd previous 3', 'TERMINAL', 0.125),
+    ('find conversation git cp how internet xcode.app', 'TERMINAL', 0.125),
+    ('Any workout', 'GENERAL', 0.0),
+    ('past messages ls 5pm', 'MEMORY_LOOKUP', 0.3333),
+    ('cloudy remember context temperature me open spotify history', 'WEATHER', 0.3333),
+    ('Safari', 'GENERAL', 0.0),
+    ('open calendar message is message this ?', 'GENERAL', 0.0),
+    ('Internet rm', 'TERMINAL', 0.125),
+    ('bash paris it', 'TERMINAL', 0.125),
+    ('it tell whats ! xcode.app upcoming reminder rain', 'GENERAL', 0.0),
+    ('mail', 'GENERAL', 0.0),
+    ('mv read , push', 'TERMINAL', 0.125),
+    ('That who . this schedule cold cold remember', 'GENERAL', 0.0),
+    ('Discord mention month', 'GENERAL', 0.0),
+    ('weather or up please', 'WEATHER', 0.3333),
+    ('with write', 'GENERAL', 0.0),
+    ('appointment of', 'GENERAL', 0.0),
+    ('bash git new start remind who when', 'TERMINAL', 0.125),
+    ('xcode.app @ cd bash', 'TERMINAL', 0.25),
+    ('emails i , ? outside the please in', 'GENERAL', 0.0),
+    ('gym', 'GENERAL', 0.0),
+    ('before meeting browse did weather', 'WEATHER', 0.3333),
+    ('Show remember discord tomorrow', 'GENERAL', 0.0),
+    ('terminal free jarvis how me', 'TERMINAL', 0.125),
+    ('a set was history past', 'MEMORY_LOOKUP', 0.3333),
+    ('conversation any mention who today free find i', 'GENERAL', 0.0),
+    ('weather appointment discussion email conversation write @ slack', 'WEATHER', 0.3333),
+    ('Available program discord browse at workout do a', 'GENERAL', 0.0),
+    ('set add pull inbox terminal', 'TERMINAL', 0.125),
+    ('ls search status', 'TERMINAL', 0.125),
+    ("spotify pull dinner what's 5pm docker", 'TERMINAL', 0.125),
+    ('up who going dinner and commit', 'GENERAL', 0.0),
+    ('commit', 'GENERAL', 0.0),
+    ('internet slack reminder open how gym search search', 'WEB_SEARCH', 0.3333),
+    ('whats mail look cd past mention hot', 'MEMORY_LOOKUP', 0.3333),
+    ('app add tell on', 'GENERAL', 0.0),
+    ("How's gym", 'GENERAL', 0.0),
+    ("what's '", 'GENERAL', 0.0),
+    ('appointment tomorrow 10:30 start gym browse', 'GENERAL', 0.0),
+    ('Mv google web ? mention me have bash google', 'TERMINAL', 0.25),
+    ('look up that ls', 'TERMINAL', 0.125),
+    ('search reminder jarvis', 'GENERAL', 0.0),
+    ('upcoming calendar bash google 3', 'TERMINAL', 0.125),
+    ('New rm tell', 'TERMINAL', 0.125),
+    ('today', 'GENERAL', 0.0),
+    ('context and 10:30 hot', 'MEMORY_LOOKUP', 0.3333),
+    ('Write today 3 shell temperature up conversation cmd', 'WEATHER', 0.3333),
+    ('Terminal', 'TERMINAL', 0.125),
+    ('messages a @', 'GENERAL', 0.0),
+    ('on', 'GENERAL', 0.0),
+    ("slack , ' app", 'GENERAL', 0.0),
+    ('email plan by mention ! before mention cp me', 'TERMINAL', 0.125),
+    ('Safari i past week how new outside', 'MEMORY_LOOKUP', 0.3333),
+    ('by any the ellis inbox previous search', 'TERMINAL', 0.125),
+    ('outside', 'GENERAL', 0.0),
+    ('london cloudy launch', 'GENERAL', 0.0),
+    ("Hot remind up history open what's meeting upcoming", 'MEMORY_LOOKUP', 0.3333),
+    ('@ start recall paris , inbox', 'GENERAL', 0.0),
+    ("Meeting ' hot", 'GENERAL', 0.0),
+    ('remember jarvis', 'GENERAL', 0.0),
+    ('ls internet', 'TERMINAL', 0.125),
+    ('event sunny a application john chrome', 'GENERAL', 0.0),
+    ("Whats by '", 'GENERAL', 0.0),
+    ('application', 'GENERAL', 0.0),
+    ('Xcode.app lunch conversation', 'GENERAL', 0.0),
+    ('earlier weather cloudy whats cold teams', 'WEATHER', 0.3333),
+    ('Firefox meeting commit', 'GENERAL', 0.0),
+    ('With cp xcode.app lunch forecast ls', 'WEATHER', 0.3333),
+    ('Status london open cp', 'TERMINAL', 0.125),
+    ('Messages for in going slack i on npm do', 'TERMINAL', 0.125),
+    ('What check me', 'GENERAL', 0.0),
+    ('calendar appointment conversation program today cp bash to', 'TERMINAL', 0.25),
+    ('do any', 'GENERAL', 0.0),
+    ('outside emails emails', 'GENERAL', 0.0),
+    ('was was', 'GENERAL', 0.0),
+    ('emails pull start history', 'MEMORY_LOOKUP', 0.3333),
+    ('Show paris free about browse , reminder inbox web', 'EMAIL_READ', 0.5),
+    ('internet going month add sunny app chrome', 'GENERAL', 0.0),
+    ('The new and my mail john', 'GENERAL', 0.0),
+    ('Xcode.app please', 'GENERAL', 0.0),
+    ('have latest read new spotify latest available did', 'GENERAL', 0.0),
+    ('safari find whats', 'GENERAL', 0.0),
+    ('10:30 teams london ls forecast any', 'WEATHER', 0.3333),
+    ('browse upcoming command', 'TERMINAL', 0.125),
+    ('how latest', 'GENERAL', 0.0),
+    ('Mail earlier i', 'GENERAL', 0.0),
+    ('browse', 'GENERAL', 0.0),
+    ('chrome going', 'GENERAL', 0.0),
+    ('check cold @ via', 'GENERAL', 0.0),
+    ('Web browse appointment', 'GENERAL', 0.0),
+    ('reminder run conversation remember appointment @ @ tomorrow', 'TERMINAL', 0.25),
+    ('discussion discord', 'GENERAL', 0.0),
+    ("Mention next what's temperature forecast", 'WEATHER', 0.6667),
+    ('Find conversation a and', 'GENERAL', 0.0),
+    ('mail up to context', 'EMAIL_SEND', 0.3333),
+    ('inbox 5pm outside', 'GENERAL', 0.0),
+    ('paris new recall google', 'GENERAL', 0.0),
+    ('For commit browse ellis recall workout mv', 'TERMINAL', 0.25),
+    ('Today', 'GENERAL', 0.0),
+    ('ellis month , xcode.app please push', 'TERMINAL', 0.125),
+    ("safari sunny mkdir event program how's emails for program", 'TERMINAL', 0.125),
+    ('Month say emails program', 'GENERAL', 0.0),
+    ('Xcode.app at by going sunny', 'GENERAL', 0.0),
+    ('next', 'GENERAL', 0.0),
+    ('shell look to check is', 'TERMINAL', 0.125),
+    ('app compose cold emails', 'GENERAL', 0.0),
+    ('please pip by start', 'TERMINAL', 0.125),
+    ('a message say cp remind', 'TERMINAL', 0.125),
+    ('What dinner', 'GENERAL', 0.0),
+    ('john going dinner of safari bash history weather', 'WEATHER', 0.3333),
+    ('available to previous execute', 'TERMINAL', 0.125),
+    ('Search busy start week firefox cold run', 'TERMINAL', 0.125),
+    ('emails messages context please', 'MEMORY_LOOKUP', 0.3333),
+    ('when reminder add mention', 'GENERAL', 0.0),
+    ('remind read was me', 'GENERAL', 0.0),
+    ('with plan', 'GENERAL', 0.0),
+    ('.', 'GENERAL', 0.0),
+    ('is discussion cloudy open xcode.app', 'APP_LAUNCH', 0.6667),
+    ('This 3 messages', 'GENERAL', 0.0),
+    ('write safari', 'GENERAL', 0.0),
+    ('Show gym outside is plan open compose chrome', 'GENERAL', 0.0),
+    ('10:30 this at workout available', 'GENERAL', 0.0),
+    ('busy appointment chrome ls recall', 'TERMINAL', 0.125),
+    ('reminder ls going to check weather tell', 'WEATHER', 0.3333),
+    ('xcode.app any was context execute temperature tell and', 'WEATHER', 0.3333),
+    ('emails command say message tomorrow', 'TERMINAL', 0.125),
+    ('In', 'GENERAL', 0.0),
+    ('Npm', 'TERMINAL', 0.125),
+    ('push available', 'GENERAL', 0.0),
+    ('pip month dinner chrome at before start next teams', 'TERMINAL', 0.125),
+    ('recall and cloudy open appointment teams schedule with shell', 'TERMINAL', 0.125),
+    ('Cmd', 'TERMINAL', 0.125),
+    ('Busy appointment .', 'GENERAL', 0.0),
+    ("mkdir app 3 remind ' say for week", 'TERMINAL', 0.125),
+    ('calendar say is', 'GENERAL', 0.0),
+    ('Email please was busy create lunch', 'GENERAL', 0.0),
+    ('application recall teams email earlier remember firefox workout', 'GENERAL', 0.0),
+    ('please about app have discussion london', 'GENERAL', 0.0),
+    ('for', 'GENERAL', 0.0),
+    ('at command tell rm google emails', 'TERMINAL', 0.25),
+    ('show firefox calendar that', 'CALENDAR_CHECK', 0.25),
+    ('emails meeting the in past cp read', 'MEMORY_LOOKUP', 0.3333),
+    ('Up', 'GENERAL', 0.0),
+    ('messages shell workout to write program', 'TERMINAL', 0.125),
+    ('messages with', 'GENERAL', 0.0),
+    ('temperature write google next john spotify 3 forecast ,', 'WEATHER', 0.3333),
+    ('check safari xcode.app tomorrow meeting', 'GENERAL', 0.0),
+    ('xcode.app email lunch shell teams chrome latest context mail', 'EMAIL_READ', 0.5),
+    ('my npm today search mention status', 'TERMINAL', 0.125),
+    ('free calendar pip paris add ellis gym', 'TERMINAL', 0.25),
+    ('git', 'GENERAL', 0.0),
+    ("Spotify 5pm docker compose calendar how's", 'TERMINAL', 0.125),
+    ("app at ' i command", 'TERMINAL', 0.125),
+    ('Create schedule docker inbox weather', 'WEATHER', 0.3333),
+    ('Any tomorrow', 'GENERAL', 0.0),
+    ('paris it', 'GENERAL', 0.0),
+    ('rm mail pull whats at event or me', 'TERMINAL', 0.125),
+    ('free execute start google weather', 'WEATHER', 0.3333),
+    ('Weather ls email commit send ls npm about', 'EMAIL_SEND', 0.3333),
+    ('messages', 'GENERAL', 0.0),
+    ('cloudy weather , via terminal was upcoming did rm', 'WEATHER', 0.3333),
+    ('this program it a ? shell', 'TERMINAL', 0.125),
+    ('forecast conversation command bash 10:30 terminal dinner check', 'WEATHER', 0.3333),
+    ('Tell past ls google via git emails run chrome', 'TERMINAL', 0.375),
+    ('appointment', 'GENERAL', 0.0),
+    ('cp lunch', 'TERMINAL', 0.125),
+    ("' mail pip slack terminal", 'TERMINAL', 0.25),
+    ('Set at git', 'GENERAL', 0.0),
+    ('Spotify', 'GENERAL', 0.0),
+    ('week messages john send next spotify command earlier sunny', 'TERMINAL', 0.125),
+    ('Going search mkdir', 'TERMINAL', 0.125),
+    ('Event lunch terminal teams busy push outside any how', 'TERMINAL', 0.125),
+    ('npm', 'TERMINAL', 0.125),
+    ('sunny tell', 'GENERAL', 0.0),
+    ('shell check cp', 'TERMINAL', 0.25),
+    ('message busy tell set or hot week status', 'GENERAL', 0.0),
+    ('set my next mv week execute internet next', 'TERMINAL', 0.25),
+]
+
+class IntentClassifierRegressionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = IntentClassifier()
+        cls.cases = CURATED_CASES + FUZZ_CASES
+    
+    def test_classify_intent_matches_frozen_table(self):
+        for text, expected_intent, expected_score in self.cases:
+            with self.subTest(text=text):
+                intent, score = self.classifier.classify_intent(text)
+                self.assertEqual(intent, Intent[expected_intent])
+                self.assertAlmostEqual(score, expected_score, delta=1e-4)
+    
+    def test_batch_matches_single(self):
+        texts = [text for text, _, _ in self.cases]
+        self.assertEqual(
+            self.classifier.classify_intent_batch(texts),
+            [self.classifier.classify_intent(text) for text in texts]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
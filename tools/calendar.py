@@ -7,9 +7,21 @@ from typing import Optional
 from dotenv import load_dotenv
 from db.memory import memory_system
 import json
+import re
 
 load_dotenv()
 
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)?')
+DATE_PATTERNS = tuple(re.compile(p) for p in (
+    r'tomorrow',
+    r'today',
+    r'next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
+    r'\d{4}-\d{2}-\d{2}',
+    r'\d{1,2}/\d{1,2}/\d{4}',
+))
+AM_PM_PATTERN = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)')
+HOUR_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+
 class CalendarCheckInput(BaseModel):
     days_ahead: int = Field(default=7, description="Number of days ahead to check for events")
 
@@ -250,7 +262,6 @@ def search_calendar_events(query: str, days_back: int = 30) -> str:
 
 def parse_natural_event(text: str) -> dict:
     """Parse natural language into event components."""
-    import re
     from dateutil.parser import parse as date_parse
     
     # Simplified parser
@@ -263,8 +274,7 @@ def parse_natural_event(text: str) -> dict:
     }
     
     # Try to extract time patterns
-    time_pattern = r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)?'
-    time_match = re.search(time_pattern, text)
+    time_match = TIME_PATTERN.search(text)
     if time_match:
         hour, minute = time_match.groups()[:2]
         am_pm = time_match.group(3)
@@ -277,16 +287,9 @@ def parse_natural_event(text: str) -> dict:
         result["time"] = f"{hour.zfill(2)}:{minute}"
     
     # Try to extract date patterns
-    date_patterns = [
-        r'tomorrow',
-        r'today',
-        r'next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-        r'\d{4}-\d{2}-\d{2}',
-        r'\d{1,2}/\d{1,2}/\d{4}',
-    ]
-    
-    for pattern in date_patterns:
-        date_match = re.search(pattern, text.lower())
+    text_lower = text.lower()
+    for pattern in DATE_PATTERNS:
+        date_match = pattern.search(text_lower)
         if date_match:
             date_text = date_match.group()
             
@@ -332,9 +335,7 @@ def _parse_time(time_str: str) -> str:
     time_str = time_str.lower().strip()
     
     # Handle AM/PM format
-    import re
-    am_pm_pattern = r'(\d{1,2}):?(\d{2})?\s*(am|pm)'
-    match = re.search(am_pm_pattern, time_str)
+    match = AM_PM_PATTERN.search(time_str)
     
     if match:
         hour = int(match.group(1))
@@ -349,8 +350,7 @@ def _parse_time(time_str: str) -> str:
         return f"{hour:02d}:{minute:02d}"
     
     # Handle 24-hour format
-    hour_pattern = r'(\d{1,2}):(\d{2})'
-    match = re.search(hour_pattern, time_str)
+    match = HOUR_PATTERN.search(time_str)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
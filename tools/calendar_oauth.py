@@ -16,6 +16,8 @@ from dateutil.parser import parse as date_parse
 from auth.google_auth import google_auth
 from db.memory import memory_system
 
+TIME_PATTERN = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)')
+
 class CalendarCheckInput(BaseModel):
     days_ahead: int = Field(default=7, description="Number of days ahead to check for events")
     calendar_id: str = Field(default="primary", description="Calendar ID ('primary' for main calendar)")
@@ -323,7 +325,7 @@ def parse_natural_datetime(datetime_str: str) -> datetime:
             target_date = now + timedelta(days=days_ahead)
             
             # Extract time if present
-            time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*(am|pm)', datetime_str)
+            time_match = TIME_PATTERN.search(datetime_str)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2)) if time_match.group(2) else 0
@@ -13,6 +13,16 @@ import re
 
 load_dotenv()
 
+# Mail settings, read once at import
+IMAP_SERVER = os.getenv('IMAP_SERVER', 'imap.gmail.com')
+IMAP_PORT = int(os.getenv('IMAP_PORT', '993'))
+SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
+EMAIL_ADDRESS = os.getenv('EMAIL_ADDRESS')
+EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')  # App password for Gmail
+
+SENDER_ADDRESS_PATTERN = re.compile(r'<.*?>')
+
 class EmailCheckInput(BaseModel):
     limit: int = Field(default=5, description="Number of recent emails to check")
     unread_only: bool = Field(default=True, description="Whether to check only unread emails")
@@ -69,18 +79,12 @@ def check_emails(limit: int = 5, unread_only: bool = True) -> str:
 def check_emails_imap(limit: int = 5, unread_only: bool = True) -> str:
     """Fallback IMAP email checking."""
     try:
-        # Gmail IMAP settings
-        imap_server = os.getenv('IMAP_SERVER', 'imap.gmail.com')
-        imap_port = int(os.getenv('IMAP_PORT', '993'))
-        email_address = os.getenv('EMAIL_ADDRESS')
-        email_password = os.getenv('EMAIL_PASSWORD')  # App password for Gmail
-        
-        if not email_address or not email_password:
+        if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
             return "❌ Email credentials not configured. Please set EMAIL_ADDRESS and EMAIL_PASSWORD in your .env file."
         
         # Connect to IMAP server
-        mail = imaplib.IMAP4_SSL(imap_server, imap_port)
-        mail.login(email_address, email_password)
+        mail = imaplib.IMAP4_SSL(IMAP_SERVER, IMAP_PORT)
+        mail.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
         mail.select('INBOX')
         
         # Search for emails
@@ -107,7 +111,7 @@ def check_emails_imap(limit: int = 5, unread_only: bool = True) -> str:
                 date = email_message['Date']
                 
                 # Clean sender (remove email address part if name is present)
-                sender_clean = re.sub(r'<.*?>', '', sender).strip()
+                sender_clean = SENDER_ADDRESS_PATTERN.sub('', sender).strip()
                 if not sender_clean:
                     sender_clean = sender
                 
@@ -185,29 +189,24 @@ def send_email(to: str, subject: str, body: str) -> str:
 def send_email_smtp(to: str, subject: str, body: str) -> str:
     """Fallback SMTP email sending."""
     try:
-        smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        smtp_port = int(os.getenv('SMTP_PORT', '587'))
-        email_address = os.getenv('EMAIL_ADDRESS')
-        email_password = os.getenv('EMAIL_PASSWORD')
-        
-        if not email_address or not email_password:
+        if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
             return "❌ Email credentials not configured. Please set EMAIL_ADDRESS and EMAIL_PASSWORD in your .env file."
         
         # Create message
         msg = MIMEMultipart()
-        msg['From'] = email_address
+        msg['From'] = EMAIL_ADDRESS
         msg['To'] = to
         msg['Subject'] = subject
         
         msg.attach(MIMEText(body, 'plain'))
         
         # Connect and send
-        server = smtplib.SMTP(smtp_server, smtp_port)
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
         server.starttls()
-        server.login(email_address, email_password)
+        server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
         
         text = msg.as_string()
-        server.sendmail(email_address, to, text)
+        server.sendmail(EMAIL_ADDRESS, to, text)
         server.quit()
         
         # Store in memory
@@ -225,16 +224,11 @@ def send_email_smtp(to: str, subject: str, body: str) -> str:
 def search_emails(query: str, limit: int = 10) -> str:
     """Search emails by sender, subject, or content."""
     try:
-        imap_server = os.getenv('IMAP_SERVER', 'imap.gmail.com')
-        imap_port = int(os.getenv('IMAP_PORT', '993'))
-        email_address = os.getenv('EMAIL_ADDRESS')
-        email_password = os.getenv('EMAIL_PASSWORD')
-        
-        if not email_address or not email_password:
+        if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
             return "❌ Email credentials not configured."
         
-        mail = imaplib.IMAP4_SSL(imap_server, imap_port)
-        mail.login(email_address, email_password)
+        mail = imaplib.IMAP4_SSL(IMAP_SERVER, IMAP_PORT)
+        mail.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
         mail.select('INBOX')
         
         # Try different search criteria
@@ -267,7 +261,7 @@ def search_emails(query: str, limit: int = 10) -> str:
                 subject = email_message['Subject'] or "No Subject"
                 date = email_message['Date']
                 
-                sender_clean = re.sub(r'<.*?>', '', sender).strip()
+                sender_clean = SENDER_ADDRESS_PATTERN.sub('', sender).strip()
                 if not sender_clean:
                     sender_clean = sender
                 
@@ -18,6 +18,8 @@ import logging
 from auth.google_auth import google_auth
 from db.memory import memory_system
 
+SENDER_PATTERN = re.compile(r'^(.*?)<(.+)>$')
+
 class GmailCheckInput(BaseModel):
     limit: int = Field(default=5, description="Number of recent emails to check")
     unread_only: bool = Field(default=True, description="Whether to check only unread emails")
@@ -81,7 +83,7 @@ def check_gmail_oauth(limit: int = 5, unread_only: bool = True, label: str = "IN
                 date_str = next((h['value'] for h in headers if h['name'] == 'Date'), '')
                 
                 # Clean sender name
-                sender_match = re.match(r'^(.*?)<(.+)>$', sender)
+                sender_match = SENDER_PATTERN.match(sender)
                 if sender_match:
                     sender_name = sender_match.group(1).strip().strip('"')
                     sender_email = sender_match.group(2)
@@ -244,7 +246,7 @@ def search_gmail_oauth(query: str, limit: int = 10, label: str = "INBOX") -> str
                 date_str = next((h['value'] for h in headers if h['name'] == 'Date'), '')
                 
                 # Clean sender
-                sender_match = re.match(r'^(.*?)<(.+)>$', sender)
+                sender_match = SENDER_PATTERN.match(sender)
                 if sender_match:
                     sender_name = sender_match.group(1).strip().strip('"')
                     sender_clean = sender_name if sender_name else sender_match.group(2)
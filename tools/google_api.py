@@ -2,7 +2,6 @@
 
 import os
 import json
-import pickle
 from pathlib import Path
 from typing import Optional, List, Dict
 import base64
@@ -35,7 +34,8 @@ class GoogleAPIManager:
     
     def __init__(self):
         self.credentials_file = os.getenv('GOOGLE_CREDENTIALS_FILE', 'auth/credentials.json')
-        self.token_file = 'auth/token.pickle'
+        self.token_file = 'auth/token.json'
+        self.legacy_token_file = 'auth/token.pickle'
         self._credentials = None
         self._gmail_service = None
         self._calendar_service = None
@@ -49,8 +49,15 @@ class GoogleAPIManager:
         
         # Load existing token
         if os.path.exists(self.token_file):
-            with open(self.token_file, 'rb') as token:
+            with open(self.token_file, 'r') as token:
+                creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
+        elif os.path.exists(self.legacy_token_file):
+            import pickle
+            with open(self.legacy_token_file, 'rb') as token:
                 creds = pickle.load(token)
+            self._save_token(creds)
+            os.remove(self.legacy_token_file)
+            logging.info("✅ Migrated token.pickle to token.json")
         
         # Get credentials if needed
         if not creds or not creds.valid:
@@ -74,22 +81,26 @@ class GoogleAPIManager:
                 logging.info("✅ Completed Google API authentication")
             
             # Save creds
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
+            self._save_token(creds)
         
         self._credentials = creds
         return True
     
+    def _save_token(self, creds: Credentials):
+        """Persist credentials as authorized-user JSON."""
+        with open(self.token_file, 'w') as token:
+            token.write(creds.to_json())
+    
     def get_gmail_service(self):
         """Get Gmail API service."""
         if not self._gmail_service and self._credentials:
-            self._gmail_service = build('gmail', 'v1', credentials=self._credentials)
+            self._gmail_service = build('gmail', 'v1', credentials=self._credentials, cache_discovery=False)
         return self._gmail_service
     
     def get_calendar_service(self):
         """Get Calendar API service."""
         if not self._calendar_service and self._credentials:
-            self._calendar_service = build('calendar', 'v3', credentials=self._credentials)
+            self._calendar_service = build('calendar', 'v3', credentials=self._credentials, cache_discovery=False)
         return self._calendar_service
     
     def is_ready(self) -> bool:
@@ -11,35 +11,38 @@ def smart_memory_lookup(query: str, search_type: str = "both") -> str:
     """Search through past conversations and stored knowledge for relevant information."""
     try:
         results = []
+        conv_results = knowledge_results = None
         
-        if search_type in ["conversations", "both"]:
-            # Search past conversations
+        # Search past conversations and/or stored knowledge
+        if search_type == "both":
+            conv_results, knowledge_results = memory_system.search_all(query, conversation_limit=3, knowledge_limit=3)
+        elif search_type == "conversations":
             conv_results = memory_system.search_conversations(query, limit=3)
-            if conv_results:
-                results.append("🧠 **Relevant Past Conversations:**")
-                for i, result in enumerate(conv_results, 1):
-                    if result["relevance_score"] > 0.6:  # Only include reasonably relevant results
-                        timestamp = result.get("timestamp", "Unknown time")
-                        tools = result.get("tools_used", [])
-                        tools_str = f" (used: {', '.join(tools)})" if tools else ""
-                        
-                        results.append(f"{i}. From {timestamp[:10]}{tools_str}:")
-                        results.append(f"   {result['content'][:300]}...")
-                        results.append("")
-        
-        if search_type in ["knowledge", "both"]:
-            # Search stored knowledge
+        elif search_type == "knowledge":
             knowledge_results = memory_system.search_knowledge(query, limit=3)
-            if knowledge_results:
-                results.append("📚 **Relevant Knowledge:**")
-                for i, result in enumerate(knowledge_results, 1):
-                    if result["relevance_score"] > 0.6:
-                        source = result.get("source", "Unknown source")
-                        category = result.get("category", "general")
-                        
-                        results.append(f"{i}. From {source} ({category}):")
-                        results.append(f"   {result['content'][:300]}...")
-                        results.append("")
+        
+        if conv_results:
+            results.append("🧠 **Relevant Past Conversations:**")
+            for i, result in enumerate(conv_results, 1):
+                if result["relevance_score"] > 0.6:  # Only include reasonably relevant results
+                    timestamp = result.get("timestamp", "Unknown time")
+                    tools = result.get("tools_used", [])
+                    tools_str = f" (used: {', '.join(tools)})" if tools else ""
+                    
+                    results.append(f"{i}. From {timestamp[:10]}{tools_str}:")
+                    results.append(f"   {result['content'][:300]}...")
+                    results.append("")
+        
+        if knowledge_results:
+            results.append("📚 **Relevant Knowledge:**")
+            for i, result in enumerate(knowledge_results, 1):
+                if result["relevance_score"] > 0.6:
+                    source = result.get("source", "Unknown source")
+                    category = result.get("category", "general")
+                    
+                    results.append(f"{i}. From {source} ({category}):")
+                    results.append(f"   {result['content'][:300]}...")
+                    results.append("")
         
         if results:
             return "\n".join(results)
@@ -8,6 +8,8 @@ import json
 
 load_dotenv()
 
+SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
+
 class WebSearchInput(BaseModel):
     query: str = Field(..., description="The search query to look up on the web")
     num_results: int = Field(default=3, description="Number of search results to return (1-10)")
@@ -79,9 +81,7 @@ def web_search(query: str, num_results: int = 3) -> str:
 # Alternative search using SerpAPI if available
 def serpapi_search(query: str, num_results: int = 3) -> str:
     """Search using SerpAPI (Google Search API) if API key is available."""
-    serpapi_key = os.getenv("SERPAPI_API_KEY")
-    
-    if not serpapi_key:
+    if not SERPAPI_API_KEY:
         return web_search(query, num_results)
     
     try:
@@ -89,7 +89,7 @@ def serpapi_search(query: str, num_results: int = 3) -> str:
         params = {
             "engine": "google",
             "q": query,
-            "api_key": serpapi_key,
+            "api_key": SERPAPI_API_KEY,
             "num": num_results,
             "hl": "en",
             "gl": "us"
@@ -120,9 +120,7 @@ def serpapi_search(query: str, num_results: int = 3) -> str:
 
 def enhanced_web_search(query: str, num_results: int = 3) -> str:
     """Enhanced web search that tries SerpAPI first, falls back to DuckDuckGo."""
-    serpapi_key = os.getenv("SERPAPI_API_KEY")
-    
-    if serpapi_key:
+    if SERPAPI_API_KEY:
         return serpapi_search(query, num_results)
     else:
         return web_search(query, num_results)
@@ -1,17 +1,56 @@
 import speech_recognition as sr
 import logging
+import queue
 
 class SpeechToText:
     def __init__(self, mic_index=0):
         self.recognizer = sr.Recognizer()
         self.mic = sr.Microphone(device_index=mic_index)
+        self.clips = queue.Queue()
+        self._stop_background = None
+        self._calibrated = False
+
+    def _calibrate(self, source):
+        # Measure ambient noise once (a second of audio); afterwards the
+        # recognizer's dynamic energy threshold keeps tracking it while listening
+        if not self._calibrated:
+            self.recognizer.adjust_for_ambient_noise(source)
+            self._calibrated = True
 
     def listen(self, timeout=10):
         with self.mic as source:
-            self.recognizer.adjust_for_ambient_noise(source)
+            self._calibrate(source)
             audio = self.recognizer.listen(source, timeout=timeout)
             return audio
 
+    def start_background(self, max_pending=2):
+        """Capture phrases on a background thread into self.clips, so the
+        microphone keeps listening while earlier clips are transcribed."""
+        if self._stop_background is not None:
+            return
+        self.clips = queue.Queue(maxsize=max_pending)
+        with self.mic as source:
+            self._calibrate(source)
+        self._stop_background = self.recognizer.listen_in_background(self.mic, self._queue_clip)
+
+    def _queue_clip(self, recognizer, audio):
+        try:
+            self.clips.put_nowait(audio)
+        except queue.Full:
+            # Keep the newest speech; the oldest clip is the least relevant
+            logging.warning("⚠️ Transcription is behind, dropping oldest audio clip.")
+            try:
+                self.clips.get_nowait()
+            except queue.Empty:
+                pass
+            self.clips.put_nowait(audio)
+
+    def stop_background(self):
+        """Stop background capture (before speaking, so replies aren't recorded)."""
+        if self._stop_background is not None:
+            self._stop_background(wait_for_stop=True)
+            self._stop_background = None
+
     def transcribe(self, audio):
         try:
             return self.recognizer.recognize_google(audio)
@@ -20,4 +59,4 @@ class SpeechToText:
             return None
         except sr.RequestError as e:
             logging.error(f"❌ STT request failed: {e}")
-            return None
\ No newline at end of file
+            return None
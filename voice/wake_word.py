@@ -0,0 +1,43 @@
+import logging
+import os
+import speech_recognition as sr
+
+try:
+    import numpy as np
+    from openwakeword.model import Model as WakeWordModel  # optional, on-device wake word
+except ImportError:
+    WakeWordModel = None
+
+# openWakeWord's pre-trained "hey jarvis" model, or a path to a custom one
+WAKE_WORD_MODEL = os.getenv("WAKE_WORD_MODEL", "hey_jarvis")
+WAKE_WORD_THRESHOLD = 0.5
+
+# The model scores 80 ms frames of 16 kHz, 16-bit mono audio
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 1280
+
+class WakeWordDetector:
+    def __init__(self, mic_index=0, model_name=WAKE_WORD_MODEL, threshold=WAKE_WORD_THRESHOLD):
+        self.model = WakeWordModel(wakeword_models=[model_name])
+        self.mic = sr.Microphone(device_index=mic_index, sample_rate=SAMPLE_RATE, chunk_size=FRAME_SAMPLES)
+        self.threshold = threshold
+
+    def wait(self) -> str:
+        """Block until the wake word is heard; returns the model that fired."""
+        self.model.reset()
+        with self.mic as source:
+            while True:
+                frame = np.frombuffer(source.stream.read(FRAME_SAMPLES), dtype=np.int16)
+                for name, score in self.model.predict(frame).items():
+                    if score >= self.threshold:
+                        return name
+
+def load_wake_word_detector(mic_index=0):
+    """Wake-word detector, or None to fall back to transcribing every clip."""
+    if WakeWordModel is None:
+        return None
+    try:
+        return WakeWordDetector(mic_index=mic_index)
+    except Exception as e:
+        logging.warning(f"⚠️ Wake-word model unavailable, transcribing clips instead: {e}")
+        return None